@@ -1,5 +1,6 @@
 from .tensor import tensor
 from .tensor_init import *
+from .functional.linalg import einsum, matmul, stack
 
 __all__ = [
     "tensor",
@@ -9,4 +10,7 @@ __all__ = [
     "rand",
     "randn",
     "arange",
+    "einsum",
+    "matmul",
+    "stack",
 ]
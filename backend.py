@@ -1,10 +1,13 @@
 # backend.py
 # This module provides a way to handle both NumPy and CuPy arrays, depending on the availability of CUDA.
-# It defines a function to get the appropriate array library based on the device specified.
+# Backends are kept in a registry keyed by device type ("cpu", "cuda", ...). Each backend holds an
+# array module and an optional table of kernels that override the default implementation of an op.
 
 # It also includes a check for the availability of CuPy and CUDA devices.
 _CUPY_AVAILABLE = False
 
+from collections import namedtuple
+
 import numpy
 try:
     import cupy
@@ -15,12 +18,79 @@ except (ImportError, RuntimeError):
     _CUPY_AVAILABLE = False
 
 
-def get_xp(device):
-    if device.startswith("cuda") :
-        if not _CUPY_AVAILABLE:
+# A kernel replaces an Operation's forward and/or backward. Both are called with the
+# operation instance first, so a kernel can stash whatever it needs for backward on it.
+Kernel = namedtuple("Kernel", ["forward", "backward"], defaults=(None, None))
+
+
+class Backend:
+    def __init__(self, name, xp, kernels=None):
+        self.name = name
+        self.xp = xp
+        self.kernels = dict(kernels or {})
+
+    def register_kernel(self, op_name, kernel):
+        self.kernels[op_name] = kernel
+
+    def get_kernel(self, op_name):
+        return self.kernels.get(op_name)
+
+    def __repr__(self):
+        return f"Backend(name={self.name!r}, xp={self.xp.__name__}, kernels={sorted(self.kernels)})"
+
+
+_BACKENDS = {}
+
+
+def _device_type(device):
+    # "cuda:0" -> "cuda"
+    return device.split(":", 1)[0]
+
+
+def register_backend(name, xp, kernels=None):
+    backend = Backend(name, xp, kernels)
+    _BACKENDS[name] = backend
+    return backend
+
+
+def get_backend(device):
+    if not isinstance(device, str):
+        raise ValueError(f"Device must be a string, got {type(device).__name__}")
+    name = _device_type(device)
+    if name not in _BACKENDS:
+        if name == "cuda":
             raise RuntimeError("CuPy not available or no CUDA device found.")
-        return cupy
-    elif device == "cpu":
-        return numpy
+        raise ValueError(f"Unsupported device: {device}. Registered devices are {sorted(_BACKENDS)}.")
+    return _BACKENDS[name]
+
+
+def available_backends():
+    return sorted(_BACKENDS)
+
+
+def get_xp(device):
+    return get_backend(device).xp
+
+
+def register_kernels(device, kernels):
+    """Install a kernel pack (dict of op name -> Kernel) on the backend for `device`."""
+    backend = get_backend(device)
+    for op_name, kernel in kernels.items():
+        backend.register_kernel(op_name, kernel)
+    return backend
+
+
+def clear_kernels(device, op_names=None):
+    """Drop registered kernels so the ops fall back to their default implementation."""
+    backend = get_backend(device)
+    if op_names is None:
+        backend.kernels.clear()
     else:
-        raise ValueError("Device must be 'cpu' or 'cuda[:id]'")
\ No newline at end of file
+        for op_name in op_names:
+            backend.kernels.pop(op_name, None)
+    return backend
+
+
+register_backend("cpu", numpy)
+if _CUPY_AVAILABLE:
+    register_backend("cuda", cupy)
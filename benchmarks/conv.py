@@ -0,0 +1,91 @@
+# Conv2d / MaxPool2d forward+backward on CIFAR-sized batches against a plain NumPy reference
+# that builds its im2col matrix from one slice per kernel offset and allocates every step.
+# Run from the directory containing the tinynet package:  python -m tinynet.benchmarks.conv
+import time
+
+import numpy as np
+
+import tinynet as tn
+import tinynet.nn as nn
+
+
+def reference_conv(x, w, b, g, stride, padding):
+    """Forward and backward of a 2-D convolution; returns (out, dx, dw, db)."""
+    N, C, H, W = x.shape
+    F, _, kh, kw = w.shape
+    xp = np.pad(x, ((0, 0), (0, 0), (padding, padding), (padding, padding)))
+    OH = (H + 2 * padding - kh) // stride + 1
+    OW = (W + 2 * padding - kw) // stride + 1
+    span_h, span_w = stride * (OH - 1) + 1, stride * (OW - 1) + 1
+    cols = np.stack([xp[:, :, i:i + span_h:stride, j:j + span_w:stride] for i in range(kh) for j in range(kw)], axis=2)
+    cols = cols.reshape(N, C * kh * kw, OH * OW).transpose(0, 2, 1).reshape(N * OH * OW, -1)
+    out = (cols @ w.reshape(F, -1).T + b).reshape(N, OH, OW, F).transpose(0, 3, 1, 2)
+
+    g2 = g.transpose(0, 2, 3, 1).reshape(-1, F)
+    dw = (g2.T @ cols).reshape(w.shape)
+    dcols = (g2 @ w.reshape(F, -1)).reshape(N, OH, OW, C, kh, kw)
+    dxp = np.zeros_like(xp)
+    for i in range(kh):
+        for j in range(kw):
+            dxp[:, :, i:i + span_h:stride, j:j + span_w:stride] += dcols[..., i, j].transpose(0, 3, 1, 2)
+    return out, dxp[:, :, padding:padding + H, padding:padding + W], dw, g2.sum(axis=0)
+
+
+def reference_max_pool(x, g, k):
+    """Non-overlapping k x k max pooling via reshape; returns (out, dx)."""
+    N, C, H, W = x.shape
+    blocks = x.reshape(N, C, H // k, k, W // k, k)
+    out = blocks.max(axis=(3, 5))
+    mask = blocks == out[:, :, :, None, :, None]
+    dx = (mask * g[:, :, :, None, :, None]).reshape(x.shape)
+    return out, dx
+
+
+def timed(fn, repeat):
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - start) / repeat * 1e3, result
+
+
+def main(batch=128, repeat=10):
+    tn.rng.manual_seed(0)
+    rng = np.random.default_rng(0)
+    print(f"{'layer':<34}{'dtype':>9}{'reference ms':>14}{'tinynet ms':>12}{'ratio':>8}{'max |dx| diff':>15}")
+    for dtype in (np.float32, np.float64):
+        for c_in, c_out, size, k, stride, padding in [(3, 32, 32, 3, 1, 1), (32, 64, 16, 3, 1, 1), (64, 64, 16, 3, 2, 1), (3, 64, 32, 5, 1, 2)]:
+            x = rng.standard_normal((batch, c_in, size, size)).astype(dtype)
+            conv = nn.Conv2d(c_in, c_out, k, stride=stride, padding=padding, dtype=dtype)
+            w, b = conv.weight.data, conv.bias.data
+            out_size = (size + 2 * padding - k) // stride + 1
+            g = rng.standard_normal((batch, c_out, out_size, out_size)).astype(dtype)
+
+            ref_ms, (_, dx_ref, _, _) = timed(lambda: reference_conv(x, w, b, g, stride, padding), repeat)
+
+            def step():
+                xt = tn.tensor(x, requires_grad=True)
+                conv.weight.grad = conv.bias.grad = None
+                conv(xt).backward(g)
+                return xt.grad.data
+            ms, dx = timed(step, repeat)
+            name = f"Conv2d {c_in}->{c_out} k{k} s{stride} p{padding} @{size}"
+            print(f"{name:<34}{np.dtype(dtype).name:>9}{ref_ms:>14.2f}{ms:>12.2f}{ms / ref_ms:>7.2f}x{np.abs(dx - dx_ref).max():>15.2e}")
+
+        for channels, size in [(32, 32), (64, 16)]:
+            x = rng.standard_normal((batch, channels, size, size)).astype(dtype)
+            g = rng.standard_normal((batch, channels, size // 2, size // 2)).astype(dtype)
+            pool = nn.MaxPool2d(2)
+            ref_ms, (_, dx_ref) = timed(lambda: reference_max_pool(x, g, 2), repeat)
+
+            def step():
+                xt = tn.tensor(x, requires_grad=True)
+                pool(xt).backward(g)
+                return xt.grad.data
+            ms, dx = timed(step, repeat)
+            name = f"MaxPool2d k2 {channels}ch @{size}"
+            print(f"{name:<34}{np.dtype(dtype).name:>9}{ref_ms:>14.2f}{ms:>12.2f}{ms / ref_ms:>7.2f}x{np.abs(dx - dx_ref).max():>15.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# Fused LayerNorm / BatchNorm1d against the same normalization composed from tensor ops.
+# Inputs are standard normal plus an optional offset; the offset rows check that float32
+# outputs stay accurate when the mean is large relative to the spread (the error column
+# is against a float64 two-pass reference).
+# Run from the directory containing the tinynet package:  python -m tinynet.benchmarks.normalization
+import time
+
+import numpy as np
+
+import tinynet as tn
+import tinynet.nn as nn
+
+
+def composed_layer_norm(x, weight, bias, eps=1e-5):
+    mean = x.mean(axis=-1, keepdims=True)
+    centered = x - mean
+    var = (centered * centered).mean(axis=-1, keepdims=True)
+    return centered / (var + eps).sqrt() * weight + bias
+
+
+def composed_batch_norm(x, weight, bias, eps=1e-5):
+    mean = x.mean(axis=0, keepdims=True)
+    centered = x - mean
+    var = (centered * centered).mean(axis=0, keepdims=True)
+    return centered / (var + eps).sqrt() * weight + bias
+
+
+def reference_norm(data, axis, eps=1e-5):
+    x = data.astype(np.float64)
+    centered = x - x.mean(axis=axis, keepdims=True)
+    return centered / np.sqrt((centered * centered).mean(axis=axis, keepdims=True) + eps)
+
+
+def bench(fn, data, grad, params, repeat=20):
+    def step():
+        x = tn.tensor(data, requires_grad=True)
+        for p in params:
+            p.grad = None
+        fn(x).backward(grad)
+        return x
+    step()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        x = step()
+    return (time.perf_counter() - start) / repeat * 1e3, x.grad.data
+
+
+def main():
+    tn.rng.manual_seed(0)
+    print(f"{'layer':<12}{'shape':<16}{'dtype':>9}{'offset':>8}{'composed ms':>13}{'fused ms':>10}{'speedup':>9}{'max |dx| diff':>15}{'max |y| err':>13}")
+    for shape in [(256, 512), (1024, 1024), (4096, 768)]:
+        for dtype, offset in [(np.float64, 0.0), (np.float32, 0.0), (np.float32, 1000.0)]:
+            data = (tn.randn(*shape, dtype=dtype).data + offset).astype(dtype)
+            grad = tn.randn(*shape, dtype=dtype).data
+
+            ln = nn.LayerNorm(shape[-1], dtype=dtype)
+            w, b = tn.tensor(ln.weight.data, requires_grad=True), tn.tensor(ln.bias.data, requires_grad=True)
+            composed_ms, dx_ref = bench(lambda x: composed_layer_norm(x, w, b), data, grad, [w, b])
+            fused_ms, dx = bench(ln, data, grad, list(ln.parameters()))
+            err = np.abs(ln(tn.tensor(data)).data - reference_norm(data, -1)).max()
+            print(f"{'LayerNorm':<12}{str(shape):<16}{np.dtype(dtype).name:>9}{offset:>8.0f}{composed_ms:>13.3f}{fused_ms:>10.3f}{composed_ms / fused_ms:>8.1f}x{np.abs(dx - dx_ref).max():>15.2e}{err:>13.2e}")
+
+            bn = nn.BatchNorm1d(shape[-1], dtype=dtype)
+            w, b = tn.tensor(bn.weight.data, requires_grad=True), tn.tensor(bn.bias.data, requires_grad=True)
+            composed_ms, dx_ref = bench(lambda x: composed_batch_norm(x, w, b), data, grad, [w, b])
+            fused_ms, dx = bench(bn, data, grad, list(bn.parameters()))
+            err = np.abs(bn(tn.tensor(data)).data - reference_norm(data, 0)).max()
+            print(f"{'BatchNorm1d':<12}{str(shape):<16}{np.dtype(dtype).name:>9}{offset:>8.0f}{composed_ms:>13.3f}{fused_ms:>10.3f}{composed_ms / fused_ms:>8.1f}x{np.abs(dx - dx_ref).max():>15.2e}{err:>13.2e}")
+
+
+if __name__ == "__main__":
+    main()
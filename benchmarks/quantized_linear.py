@@ -0,0 +1,68 @@
+# Accuracy vs speed of int8 QuantizedLinear against the float Linear it replaces.
+# Run from the directory containing the tinynet package:  python -m tinynet.benchmarks.quantized_linear
+import time
+
+import numpy as np
+
+import tinynet as tn
+import tinynet.nn as nn
+
+
+class MLP(nn.Module):
+    def __init__(self, sizes, dtype):
+        super().__init__()
+        self.n_layers = len(sizes) - 1
+        for i, (n_in, n_out) in enumerate(zip(sizes[:-1], sizes[1:])):
+            setattr(self, f"linear{i}", nn.Linear(n_in, n_out, dtype=dtype))
+        self.relu = nn.ReLU()
+
+    def forward(self, x):
+        # Look layers up by attribute so quantize() swapping them in _modules takes effect
+        for i in range(self.n_layers - 1):
+            x = self.relu(getattr(self, f"linear{i}")(x))
+        return getattr(self, f"linear{self.n_layers - 1}")(x)
+
+
+def bench(fn, repeat=20):
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e3
+
+
+def weight_bytes(model):
+    total = 0
+    for module in model._modules.values():
+        if isinstance(module, nn.QuantizedLinear):
+            total += module.weight_q.nbytes
+        elif isinstance(module, nn.Linear):
+            total += module.weight.data.nbytes
+    return total
+
+
+def main():
+    tn.rng.manual_seed(0)
+    print(f"{'sizes':<22}{'batch':>6}{'dtype':>9}{'float ms':>10}{'int8 ms':>9}{'weights':>10}{'rel err':>10}{'top1 agree':>12}")
+    for sizes in [(256, 512, 10), (1024, 2048, 2048, 10), (4096, 4096, 10)]:
+        for dtype in (np.float64, np.float32):
+            for batch in (1, 64):
+                model = MLP(sizes, dtype)
+                x = tn.randn(batch, sizes[0], dtype=dtype)
+                calibration = tn.randn(256, sizes[0], dtype=dtype)
+                ref = model(x).data
+                float_ms = bench(lambda: model(x))
+                float_bytes = weight_bytes(model)
+
+                qmodel = nn.quantize(model, calibration)
+                out = qmodel(x).data
+                int8_ms = bench(lambda: qmodel(x))
+
+                rel_err = float(np.abs(out - ref).max() / np.abs(ref).max())
+                agree = float((out.argmax(axis=1) == ref.argmax(axis=1)).mean())
+                ratio = float_bytes / weight_bytes(qmodel)
+                print(f"{str(sizes):<22}{batch:>6}{np.dtype(dtype).name:>9}{float_ms:>10.3f}{int8_ms:>9.3f}{ratio:>9.1f}x{rel_err:>10.4f}{agree:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
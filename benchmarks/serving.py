@@ -0,0 +1,70 @@
+# Load test for tinynet.serving.BatchingServer. An in-process client fires single-example
+# requests with Poisson arrivals at a fixed rate; the same load is served one request per
+# forward (max_batch_size=1) and with dynamic micro-batching.
+# Run from the directory containing the tinynet package:  python -m tinynet.benchmarks.serving
+import argparse
+import asyncio
+import time
+
+import numpy as np
+
+import tinynet as tn
+import tinynet.nn as nn
+from tinynet.serving import BatchingServer
+
+
+class MLP(nn.Module):
+    def __init__(self, sizes):
+        super().__init__()
+        self.fc1 = nn.Linear(sizes[0], sizes[1], dtype=np.float32)
+        self.fc2 = nn.Linear(sizes[1], sizes[2], dtype=np.float32)
+        self.fc3 = nn.Linear(sizes[2], sizes[3], dtype=np.float32)
+        self.act = nn.ReLU()
+
+    def forward(self, x):
+        return self.fc3(self.act(self.fc2(self.act(self.fc1(x)))))
+
+
+async def client(server, examples, rate, seed=0):
+    """Open-loop client: request i is sent at its scheduled arrival time regardless of replies."""
+    rng = np.random.default_rng(seed)
+    start = time.perf_counter()
+    arrivals = start + np.cumsum(rng.exponential(1.0 / rate, len(examples)))
+    tasks = []
+    for example, at in zip(examples, arrivals):
+        delay = at - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(server.predict(example)))
+    outputs = await asyncio.gather(*tasks)
+    return outputs, len(examples) / (time.perf_counter() - start)
+
+
+async def run(model, examples, rate, max_batch_size, max_wait_ms):
+    async with BatchingServer(model, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms) as server:
+        outputs, throughput = await client(server, examples, rate)
+        return np.stack(outputs), throughput, server.metrics()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=4000)
+    parser.add_argument("--rate", type=float, default=4000.0, help="requests per second")
+    parser.add_argument("--max-batch-size", type=int, default=64)
+    parser.add_argument("--max-wait-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    tn.rng.manual_seed(0)
+    model = MLP((784, 1024, 1024, 10))
+    examples = np.random.default_rng(1).standard_normal((args.requests, 784)).astype(np.float32)
+    expected = model(tn.tensor(examples)).data
+
+    print(f"{args.requests} requests at {args.rate:.0f} req/s")
+    print(f"{'mode':<22}{'req/s':>9}{'p50 ms':>9}{'p99 ms':>9}{'mean batch':>12}{'max |diff|':>12}")
+    for name, max_batch_size in [("one per forward", 1), ("micro-batched", args.max_batch_size)]:
+        outputs, throughput, m = asyncio.run(run(model, examples, args.rate, max_batch_size, args.max_wait_ms))
+        print(f"{name:<22}{throughput:>9.0f}{m['p50_ms']:>9.2f}{m['p99_ms']:>9.2f}{m['mean_batch_size']:>12.1f}{np.abs(outputs - expected).max():>12.2e}")
+
+
+if __name__ == "__main__":
+    main()
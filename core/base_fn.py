@@ -4,10 +4,10 @@ def binary_op(a, b, OpClass, **kwargs):
 
     if requires_grad:
         op = OpClass(**kwargs)
-        data = op.forward(a, b)
+        data = op.apply(a, b)
     else:
         op = None
-        data = OpClass(**kwargs).forward(a, b)  # Could be optimized further if backend supports nograd ops
+        data = OpClass(**kwargs).apply(a, b)  # Could be optimized further if backend supports nograd ops
 
     return data, requires_grad, op
 
@@ -18,10 +18,10 @@ def unary_op(x, OpClass, **kwargs):
 
     if requires_grad:
         op = OpClass(**kwargs)
-        data = op.forward(x)
+        data = op.apply(x)
     else:
         op = None
-        data = OpClass(**kwargs).forward(x)
+        data = OpClass(**kwargs).apply(x)
 
     return data, requires_grad, op
 
@@ -32,9 +32,19 @@ def scalar_op(scalar, x, OpClass, is_scalar_first=False):
 
     if requires_grad:
         op = OpClass(scalar, is_scalar_first)
-        data = op.forward(x)
+        data = op.apply(x)
     else:
         op = None
-        data = OpClass(scalar, is_scalar_first).forward(x)
+        data = OpClass(scalar, is_scalar_first).apply(x)
 
     return data, requires_grad, op
+
+
+def nary_op(inputs, OpClass, **kwargs):
+    assert all(hasattr(x, 'data') for x in inputs), f"Invalid inputs to nary_op: {inputs}"
+    requires_grad = any(x.requires_grad for x in inputs)
+
+    op = OpClass(**kwargs)
+    data = op.apply(*inputs)
+
+    return data, requires_grad, op if requires_grad else None
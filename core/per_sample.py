@@ -0,0 +1,28 @@
+# core/per_sample.py
+# State for per-sample gradient capture. While a capture is active, operations whose
+# inputs are tracked parameters also emit that input's gradient with the leading
+# (batch) axis kept, which is accumulated into `param.grad_sample`.
+
+_tracked = None
+
+def start(params):
+    global _tracked
+    _tracked = {id(p) for p in params}
+    for p in params:
+        p.grad_sample = None
+
+def stop():
+    global _tracked
+    _tracked = None
+
+def active():
+    return _tracked is not None
+
+def is_tracked(x):
+    return _tracked is not None and id(x) in _tracked
+
+def accumulate(param, grad_sample):
+    if param.grad_sample is None:
+        param.grad_sample = grad_sample
+    else:
+        param.grad_sample = param.grad_sample + grad_sample
@@ -1,6 +1,7 @@
 from ..ops.basic_ops import *
 from ..ops.math_ops import *
-from ..core.base_fn import binary_op, unary_op, scalar_op
+from ..ops.einsum_ops import Einsum
+from ..core.base_fn import binary_op, unary_op, scalar_op, nary_op
 
 
 # Binary operations
@@ -23,6 +24,14 @@ def matmul(a, b):
     return binary_op(a, b, MatMul)
 
 
+# N-ary operations
+def einsum(subscripts, *operands):
+    return nary_op(operands, Einsum, subscripts=subscripts)
+
+def stack(tensors, axis=0):
+    return nary_op(tensors, Stack, axis=axis)
+
+
 # Scalar operations
 def scalar_add(scalar, x, is_scalar_first=False):
     return scalar_op(scalar, x, ScalarAdd, is_scalar_first)
@@ -11,10 +11,80 @@ def unbroadcast(grad, shape):
             grad = grad.sum(axis=i, keepdims=True)
     return grad.reshape(shape)
 
-def expand_grad(grad, target_shape, axis):
-    # Expand grad to match input shape
-    target = list(grad.data.shape)
-    for ax in (axis,) if isinstance(axis, int) else axis:
-        target.insert(ax, 1)
-    grad.data = grad.data.reshape(target)
-    return grad.data.repeat(target_shape[ax], axis=ax)
+def pair(v):
+    # (h, w) from an int or a 2-sequence, for kernel size / stride / padding arguments
+    return (v, v) if isinstance(v, int) else tuple(v)
+
+def reduced_axes(axis, ndim):
+    # Normalized, sorted tuple of the axes a reduction ran over
+    if axis is None:
+        return tuple(range(ndim))
+    return tuple(sorted(ax % ndim for ax in ((axis,) if isinstance(axis, int) else axis)))
+
+def expand_grad(xp, grad, target_shape, axis, keepdims=False):
+    """
+    Broadcast the gradient of a reduction over `axis` back to the input shape. The result
+    is a read-only view; the engine copies it when wrapping it into a tensor.
+    """
+    if not keepdims:
+        shape = list(grad.shape)
+        for ax in reduced_axes(axis, len(target_shape)):
+            shape.insert(ax, 1)
+        grad = grad.reshape(shape)
+    return xp.broadcast_to(grad, target_shape)
+
+def unbroadcast_per_sample(grad, shape):
+    """
+    Like unbroadcast, but keep the leading (batch) axis of grad so the result has
+    shape (batch, *shape). The target must not itself carry the batch axis.
+    """
+    padded = (1,) * (grad.ndim - len(shape)) + tuple(shape)
+    if len(padded) != grad.ndim or padded[0] != 1:
+        raise ValueError(f"Cannot compute per-sample gradient for shape {shape} from grad of shape {grad.shape}")
+    axes = tuple(i for i in range(1, grad.ndim) if padded[i] == 1 and grad.shape[i] != 1)
+    if axes:
+        grad = grad.sum(axis=axes, keepdims=True)
+    return grad.reshape((grad.shape[0],) + tuple(shape))
+
+class IndexedGrad:
+    """
+    Gradient that is zero except at `index`, where it equals `value`. Ops that read a
+    slice of an input (indexing, one timestep of a sequence) return this instead of a
+    full-size array; the engine adds it into a single buffer per input.
+    """
+    def __init__(self, index, value):
+        self.index = index
+        self.value = value
+
+def _is_advanced_int_index(idx):
+    for item in idx if isinstance(idx, tuple) else (idx,):
+        if isinstance(item, (list, range)) or (hasattr(item, 'dtype') and item.dtype.kind in 'iu' and item.ndim > 0):
+            return True
+    return False
+
+def accumulate_grad(grads, owned, parent, grad):
+    """
+    Add `grad` into grads[id(parent)]. Buffers listed in `owned` were allocated here and
+    are updated in place; others may alias arrays returned by an op and are copied first.
+    """
+    key = id(parent)
+    xp = parent.xp
+    if isinstance(grad, IndexedGrad):
+        if key not in grads:
+            grads[key] = xp.zeros(parent.data.shape, dtype=parent.dtype)
+            owned.add(key)
+        elif key not in owned:
+            grads[key] = xp.array(xp.broadcast_to(grads[key], parent.data.shape), dtype=parent.dtype)
+            owned.add(key)
+        if _is_advanced_int_index(grad.index):
+            # repeated indices must each contribute
+            xp.add.at(grads[key], grad.index, grad.value)
+        else:
+            grads[key][grad.index] += grad.value
+    elif key not in grads:
+        grads[key] = grad
+    elif key in owned:
+        grads[key] += grad
+    else:
+        grads[key] = grads[key] + grad
+        owned.add(key)
@@ -0,0 +1,37 @@
+# core/workspace.py
+import weakref
+
+
+class Workspace:
+    """
+    Scratch buffers owned by a layer and reused across steps. A buffer handed to an
+    operation stays reserved until that operation releases it (after backward) or is
+    garbage collected; asking for it while it is still reserved yields a fresh array,
+    so overlapping forwards never share scratch memory.
+    """
+    def __init__(self):
+        self._buffers = {}
+
+    def get(self, xp, name, shape, dtype, owner, fill=None):
+        """Buffer of `shape`/`dtype`. `fill` is applied only when the buffer is (re)allocated."""
+        shape, dtype = tuple(shape), xp.dtype(dtype)
+        entry = self._buffers.get(name)
+        if entry is not None:
+            buf, holder = entry
+            if holder is not None and holder() is not None:
+                return self._allocate(xp, shape, dtype, fill)
+            if isinstance(buf, xp.ndarray) and buf.shape == shape and buf.dtype == dtype:
+                self._buffers[name] = (buf, weakref.ref(owner))
+                return buf
+        buf = self._allocate(xp, shape, dtype, fill)
+        self._buffers[name] = (buf, weakref.ref(owner))
+        return buf
+
+    def release(self, owner):
+        for name, (buf, holder) in self._buffers.items():
+            if holder is not None and holder() is owner:
+                self._buffers[name] = (buf, None)
+
+    @staticmethod
+    def _allocate(xp, shape, dtype, fill):
+        return xp.empty(shape, dtype=dtype) if fill is None else xp.full(shape, fill, dtype=dtype)
@@ -1,6 +1,21 @@
-from ..functional.activations import relu, sigmoid
+from ..functional.activations import relu, sigmoid, dropout
+from ..functional.linear import linear
+from ..functional.linalg import einsum, matmul, stack
+from ..functional.attention import scaled_dot_product_attention
+from ..functional.normalization import layer_norm, batch_norm
+from ..functional.conv import conv2d, max_pool2d
 
 __all__ = [
     "relu",
     "sigmoid",
+    "dropout",
+    "linear",
+    "einsum",
+    "matmul",
+    "stack",
+    "scaled_dot_product_attention",
+    "layer_norm",
+    "batch_norm",
+    "conv2d",
+    "max_pool2d",
 ]
@@ -1,10 +1,19 @@
 from ..tensor import tensor
-from ..ops.activations import Sigmoid, ReLU
+from ..ops.activations import Sigmoid, ReLU, Dropout
 
 def acivation_op(x, OpClass):
     op = OpClass()
-    data = op.forward(x)
-    return tensor(data, x.requires_grad, parents=[x], op=op, device=x.device, dtype=x.dtype)
+    data = op.apply(x)
+    return tensor(data, x.requires_grad, parents=[x], op=op if x.requires_grad else None, device=x.device, dtype=x.dtype)
 
 sigmoid = lambda x: acivation_op(x, Sigmoid)
-relu = lambda x: acivation_op(x, ReLU)
\ No newline at end of file
+relu = lambda x: acivation_op(x, ReLU)
+
+def dropout(x, p=0.5, training=True, generator=None):
+    if not 0.0 <= p < 1.0:
+        raise ValueError(f"Dropout probability must be in [0, 1), got {p}")
+    if not training or p == 0.0:
+        return x
+    op = Dropout(p, generator)
+    data = op.apply(x)
+    return tensor(data, x.requires_grad, parents=[x], op=op if x.requires_grad else None, device=x.device, dtype=x.dtype)
@@ -0,0 +1,12 @@
+from ..tensor import tensor
+from ..ops.attention_ops import ScaledDotProductAttention
+
+def scaled_dot_product_attention(q, k, v, causal=False, scale=None, block_size=128):
+    """
+    softmax(q @ k^T * scale) @ v, evaluated over blocks of `block_size` keys so memory
+    grows linearly with sequence length. `scale` defaults to 1/sqrt(d).
+    """
+    op = ScaledDotProductAttention(causal=causal, scale=scale, block_size=block_size)
+    data = op.apply(q, k, v)
+    requires_grad = q.requires_grad or k.requires_grad or v.requires_grad
+    return tensor(data, requires_grad, parents=[q, k, v], op=op if requires_grad else None, device=q.device, dtype=data.dtype)
@@ -0,0 +1,18 @@
+from ..tensor import tensor
+from ..core.base_fn import nary_op
+from ..core.utils import pair
+from ..ops.conv_ops import Conv2d, MaxPool2d
+
+def conv2d(x, weight, bias=None, stride=1, padding=0, workspace=None):
+    """
+    x: (N, C, H, W), weight: (F, C, kh, kw), bias: (F,). Pass a `core.workspace.Workspace`
+    to reuse the im2col buffers across calls.
+    """
+    inputs = [x, weight] if bias is None else [x, weight, bias]
+    data, requires_grad, op = nary_op(inputs, Conv2d, stride=pair(stride), padding=pair(padding), workspace=workspace)
+    return tensor(data, requires_grad, parents=inputs, op=op, device=x.device, dtype=data.dtype)
+
+def max_pool2d(x, kernel_size, stride=None, padding=0, workspace=None):
+    stride = None if stride is None else pair(stride)
+    data, requires_grad, op = nary_op([x], MaxPool2d, kernel_size=pair(kernel_size), stride=stride, padding=pair(padding), workspace=workspace)
+    return tensor(data, requires_grad, parents=[x], op=op, device=x.device, dtype=data.dtype)
@@ -0,0 +1,14 @@
+from ..tensor import tensor
+from ..core import tensor_fn
+
+def einsum(subscripts, *operands):
+    data, requires_grad, op = tensor_fn.einsum(subscripts, *operands)
+    return tensor(data, requires_grad, parents=list(operands), op=op, device=operands[0].device, dtype=data.dtype)
+
+def matmul(a, b):
+    return a @ b
+
+def stack(tensors, axis=0):
+    tensors = list(tensors)
+    data, requires_grad, op = tensor_fn.stack(tensors, axis)
+    return tensor(data, requires_grad, parents=tensors, op=op, device=tensors[0].device, dtype=data.dtype)
@@ -0,0 +1,14 @@
+from ..tensor import tensor
+from ..sparse import csr_tensor
+from ..ops.basic_ops import Linear
+
+def linear(x, weight, bias=None):
+    if bias is None:
+        return x @ weight
+    if isinstance(x, csr_tensor) or weight.data.ndim > 2:
+        # Sparse inputs and stacked (ensemble) weights go through the broadcasting ops
+        return x @ weight + bias
+    op = Linear()
+    data = op.apply(x, weight, bias)
+    requires_grad = x.requires_grad or weight.requires_grad or bias.requires_grad
+    return tensor(data, requires_grad, parents=[x, weight, bias], op=op if requires_grad else None, device=x.device, dtype=data.dtype)
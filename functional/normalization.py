@@ -0,0 +1,23 @@
+from ..tensor import tensor
+from ..core.base_fn import nary_op
+from ..ops.norm_ops import LayerNorm, BatchNorm
+
+def _as_tensor(param, x):
+    # Plain numbers and arrays are constants with the input's device and dtype
+    if param is None or isinstance(param, tensor):
+        return param
+    return tensor(param, device=x.device, dtype=x.dtype)
+
+def _norm_op(OpClass, x, weight, bias, **kwargs):
+    weight, bias = _as_tensor(weight, x), _as_tensor(bias, x)
+    inputs = [x] + [p for p in (weight, bias) if p is not None]
+    data, requires_grad, op = nary_op(inputs, OpClass, has_weight=weight is not None, has_bias=bias is not None, **kwargs)
+    return tensor(data, requires_grad, parents=inputs, op=op, device=x.device, dtype=data.dtype)
+
+def layer_norm(x, normalized_shape, weight=None, bias=None, eps=1e-5):
+    n_dims = 1 if isinstance(normalized_shape, int) else len(normalized_shape)
+    return _norm_op(LayerNorm, x, weight, bias, n_dims=n_dims, eps=eps)
+
+def batch_norm(x, running_mean=None, running_var=None, weight=None, bias=None, training=True, momentum=0.1, eps=1e-5):
+    """running_mean/running_var are raw arrays updated in place when training."""
+    return _norm_op(BatchNorm, x, weight, bias, running_mean=running_mean, running_var=running_var, training=training, momentum=momentum, eps=eps)
@@ -0,0 +1,5 @@
+from ..kernels.cpu_inplace import KERNELS as CPU_INPLACE_KERNELS
+
+__all__ = [
+    "CPU_INPLACE_KERNELS",
+]
@@ -0,0 +1,68 @@
+# Tuned CPU kernel pack.
+# Same math as the default ops, but written with out= / in-place NumPy calls so each op
+# allocates at most one output buffer. Sum and Mean are left to the default ops, which
+# already broadcast their gradient. Install with `register_kernels("cpu", KERNELS)`.
+import numpy as np
+
+from ..backend import Kernel
+
+
+def _sigmoid_forward(op, x):
+    s = np.negative(x.data)
+    np.exp(s, out=s)
+    s += 1
+    np.reciprocal(s, out=s)
+    op.s = s
+    return s
+
+def _sigmoid_backward(op, grad, x):
+    out = np.subtract(1, op.s)
+    out *= op.s
+    out *= grad.data
+    return (out,)
+
+
+def _relu_forward(op, x):
+    op.mask = x.data > 0
+    return np.maximum(x.data, 0)
+
+def _relu_backward(op, grad, x):
+    return (np.multiply(grad.data, op.mask),)
+
+
+def _linear_forward(op, x, weight, bias):
+    op.x_shape = x.data.shape
+    out = x.data @ weight.data
+    out += bias.data
+    return out
+
+def _linear_backward(op, grad, x, weight, bias):
+    grad_data = grad.data
+    grad_2d = grad_data.reshape(-1, grad_data.shape[-1])
+    x_2d = x.data.reshape(-1, x.data.shape[-1])
+    grad_x = (grad_data @ weight.data.T).reshape(op.x_shape)
+    grad_w = x_2d.T @ grad_2d
+    grad_b = np.add.reduce(grad_2d, axis=0)
+    return grad_x, grad_w, grad_b
+
+
+def _log_softmax_forward(op, x):
+    out = x.data - np.max(x.data, axis=op.axis, keepdims=True)
+    sumexp = np.exp(out)
+    sumexp = np.add.reduce(sumexp, axis=op.axis, keepdims=True)
+    out -= np.log(sumexp, out=sumexp)
+    op.out = out
+    return out
+
+def _log_softmax_backward(op, grad, x):
+    softmax = np.exp(op.out)
+    softmax *= np.add.reduce(grad.data, axis=op.axis, keepdims=True)
+    return (np.subtract(grad.data, softmax, out=softmax),)
+
+
+KERNELS = {
+    "Sigmoid": Kernel(_sigmoid_forward, _sigmoid_backward),
+    "ReLU": Kernel(_relu_forward, _relu_backward),
+    "Linear": Kernel(_linear_forward, _linear_backward),
+    "LogSoftmax": Kernel(_log_softmax_forward, _log_softmax_backward),
+}
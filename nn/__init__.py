@@ -1,5 +1,10 @@
 from ..nn.losses import *
-from ..nn.modules import Module, Linear, ReLU, Sigmoid
+from ..nn.modules import Module, Linear, ReLU, Sigmoid, Dropout
+from ..nn.quantized import QuantizedLinear, quantize
+from ..nn.ensemble import Ensemble
+from ..nn.recurrent import RNN, GRU, LSTM
+from ..nn.normalization import LayerNorm, BatchNorm1d
+from ..nn.conv import Conv2d, MaxPool2d
 
 __all__ = [
     "CrossEntropyLoss",
@@ -8,4 +13,15 @@ __all__ = [
     "Linear",
     "ReLU",
     "Sigmoid",
+    "Dropout",
+    "QuantizedLinear",
+    "quantize",
+    "Ensemble",
+    "RNN",
+    "GRU",
+    "LSTM",
+    "LayerNorm",
+    "BatchNorm1d",
+    "Conv2d",
+    "MaxPool2d",
 ]
\ No newline at end of file
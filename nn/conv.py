@@ -0,0 +1,42 @@
+from ..tensor import tensor
+from .. import rng
+from ..core.utils import pair
+from ..core.workspace import Workspace
+from ..functional import conv2d, max_pool2d
+from ..nn.modules import Module
+
+
+class Conv2d(Module):
+    def __init__(self, in_channels, out_channels, kernel_size, stride=1, padding=0, *, bias=True, device='cpu', dtype=None, generator=None):
+        super().__init__()
+        self.in_channels = in_channels
+        self.out_channels = out_channels
+        self.kernel_size = pair(kernel_size)
+        self.stride = pair(stride)
+        self.padding = pair(padding)
+        # im2col scratch space, reused from one step to the next
+        self.workspace = Workspace()
+
+        bound = (in_channels * self.kernel_size[0] * self.kernel_size[1]) ** -0.5
+        init = lambda *shape: tensor(rng.uniform(shape, -bound, bound, dtype=dtype, generator=generator, device=device), requires_grad=True, device=device, dtype=dtype)
+        self.weight = init(out_channels, in_channels, *self.kernel_size)
+        self.bias = init(out_channels) if bias else None
+
+    def forward(self, x):
+        if x.data.ndim != 4 or x.shape[1] != self.in_channels:
+            raise ValueError(f"Conv2d expects input of shape (N, {self.in_channels}, H, W), got {x.shape}")
+        return conv2d(x, self.weight, self.bias, self.stride, self.padding, workspace=self.workspace)
+
+
+class MaxPool2d(Module):
+    def __init__(self, kernel_size, stride=None, padding=0):
+        super().__init__()
+        self.kernel_size = pair(kernel_size)
+        self.stride = self.kernel_size if stride is None else pair(stride)
+        self.padding = pair(padding)
+        if any(2 * p > k for p, k in zip(self.padding, self.kernel_size)):
+            raise ValueError(f"padding should be at most half of kernel_size, got padding={padding}, kernel_size={kernel_size}")
+        self.workspace = Workspace()
+
+    def forward(self, x):
+        return max_pool2d(x, self.kernel_size, self.stride, self.padding, workspace=self.workspace)
@@ -0,0 +1,97 @@
+import copy
+
+from ..tensor import tensor
+from ..nn.modules import Module, Linear
+
+
+def _stacked_shape(name, shape, n):
+    # Linear weights become (N, in, out) for batched matmul; biases (N, 1, out) so they
+    # broadcast over the batch axis of (N, B, out) activations
+    if name == "bias":
+        return (n, 1) + tuple(shape)
+    return (n,) + tuple(shape)
+
+
+# Vectorized ensemble: N identically structured modules trained in one pass. Their
+# parameters are stacked along a leading member axis inside a single template module,
+# so each Linear becomes one batched matmul instead of N small ones. Linear is the only
+# layer with parameters that runs stacked; parameter-free layers (activations,
+# containers) apply elementwise or recurse. Stacked parameters carry `n_members`, which
+# optimizers check before applying per-member hyperparameters.
+class Ensemble(Module):
+    def __init__(self, members):
+        super().__init__()
+        members = list(members)
+        if not members:
+            raise ValueError("Ensemble needs at least one member")
+        self.n_members = len(members)
+        self._shapes = {}
+        self.template = copy.deepcopy(members[0])
+        self._stack(self.template, members, prefix='')
+        self._mark()
+
+    def _stack(self, template, members, prefix):
+        if any(type(m) is not type(template) for m in members):
+            raise ValueError(f"Ensemble members differ in module {prefix.rstrip('.') or 'root'}")
+        if template._parameters and not isinstance(template, Linear):
+            raise TypeError(
+                f"Ensemble can only stack Linear layers, but {prefix.rstrip('.') or 'the member'} is a "
+                f"{type(template).__name__} with parameters"
+            )
+        for name, param in list(template._parameters.items()):
+            params = [m._parameters.get(name) for m in members]
+            if any(p is None or p.shape != param.shape for p in params):
+                raise ValueError(f"Ensemble members differ in parameter {prefix}{name}")
+            xp = param.xp
+            shape = _stacked_shape(name, param.shape, self.n_members)
+            data = xp.stack([p.data for p in params]).reshape(shape)
+            self._shapes[f"{prefix}{name}"] = param.shape
+            setattr(template, name, tensor(data, requires_grad=True, device=param.device, dtype=param.dtype))
+        for name, module in template._modules.items():
+            if any(name not in m._modules for m in members):
+                raise ValueError(f"Ensemble members differ in module {prefix}{name}")
+            self._stack(module, [m._modules[name] for m in members], f"{prefix}{name}.")
+
+    def _mark(self):
+        for param in self.parameters():
+            param.n_members = self.n_members
+
+    def to(self, device):
+        # Moving replaces every parameter tensor, so the new ones are marked again
+        super().to(device)
+        self._mark()
+
+    def forward(self, x):
+        """
+        `x` is either shared by all members, shape (B, ...), or per member, shape (N, B, ...).
+        Returns the stacked outputs of shape (N, B, ...).
+        """
+        return self.template(x)
+
+    def loss(self, loss_fn, pred, target):
+        """
+        Sum of the members' losses, so every member receives exactly the gradient it would
+        get when trained alone. `target` is per member when its shape starts with (N, B);
+        otherwise it is shared by all members.
+        """
+        n, b = pred.shape[0], pred.shape[1]
+        xp = pred.xp
+        target_data = target.data if isinstance(target, tensor) else xp.asarray(target)
+        if target_data.shape[:2] != (n, b):
+            target_data = xp.broadcast_to(target_data, (n,) + target_data.shape)
+        target_data = target_data.reshape((n * b,) + target_data.shape[2:])
+        flat = pred.reshape(n * b, *pred.shape[2:])
+        return loss_fn(flat, tensor(target_data, device=pred.device, dtype=target_data.dtype)) * n
+
+    def member(self, i):
+        """Return member `i` as a standalone module holding a copy of its parameters."""
+        module = copy.deepcopy(self.template)
+        self._unstack(module, i, prefix='')
+        return module
+
+    def _unstack(self, module, i, prefix):
+        for name, param in list(module._parameters.items()):
+            data = param.data[i].reshape(self._shapes[f"{prefix}{name}"]).copy()
+            setattr(module, name, tensor(data, requires_grad=True, device=param.device, dtype=param.dtype))
+        for name, child in module._modules.items():
+            self._unstack(child, i, f"{prefix}{name}.")
@@ -1,11 +1,12 @@
 from ..tensor import tensor
-from ..backend import get_xp
+from .. import rng
 from ..tensor_init import *
 from ..functional import *
 
 class Module:
     def __init__(self):
         self._parameters = {}
+        self._buffers = {}
         self._modules = {}
         self.training = True
 
@@ -19,6 +20,11 @@ class Module:
         if isinstance(param, tensor) and param.requires_grad:
             self._parameters[name] = param
 
+    # Non-trainable state (e.g. running statistics) that should follow the module across devices
+    def register_buffer(self, name, buf):
+        self._buffers[name] = buf
+        object.__setattr__(self, name, buf)
+
     def add_module(self, name, module):
         if isinstance(module, Module):
             self._modules[name] = module
@@ -49,6 +55,8 @@ class Module:
         # Update self's parameters
         for name, param in self._parameters.items():
             setattr(self, name, param.to(device))  # Update the attribute and internal dict
+        for name, buf in self._buffers.items():
+            self.register_buffer(name, buf.to(device))
 
         # Recursively update submodules
         for name, module in self._modules.items():
@@ -64,19 +72,18 @@ class Module:
 
 
 class Linear(Module):
-    def __init__(self, in_features, out_features, *, bias=True, gain=1.0, device='cpu', dtype=None):
+    def __init__(self, in_features, out_features, *, bias=True, gain=1.0, device='cpu', dtype=None, generator=None):
         super().__init__()
-        xp = get_xp(device)
         fan_in, fan_out = in_features, out_features
-        std = gain * xp.sqrt(2.0 / (fan_in + fan_out))
-        self.weight = tensor(xp.random.normal(0.0, std, size=(fan_in, fan_out)), requires_grad=True, device=device, dtype=dtype)
+        std = gain * (2.0 / (fan_in + fan_out)) ** 0.5
+        self.weight = tensor(rng.normal((fan_in, fan_out), 0.0, std, dtype=dtype, generator=generator, device=device), requires_grad=True, device=device, dtype=dtype)
         if bias:
-            self.bias = tensor(xp.random.normal(0.0, std, size=(fan_out,)), requires_grad=True, device=device, dtype=dtype)
+            self.bias = tensor(rng.normal((fan_out,), 0.0, std, dtype=dtype, generator=generator, device=device), requires_grad=True, device=device, dtype=dtype)
         else:
             self.bias = None
 
     def forward(self, x):
-        return x @ self.weight + self.bias
+        return linear(x, self.weight, self.bias)
     
 class ReLU(Module):
     def __init__(self):
@@ -92,3 +99,16 @@ class Sigmoid(Module):
     def forward(self, x):
         return sigmoid(x)
 
+
+class Dropout(Module):
+    def __init__(self, p=0.5, *, generator=None):
+        super().__init__()
+        if not 0.0 <= p < 1.0:
+            raise ValueError(f"Dropout probability must be in [0, 1), got {p}")
+        self.p = p
+        self.generator = generator
+
+    def forward(self, x):
+        if not self.training or self.p == 0.0:
+            return x
+        return dropout(x, self.p, generator=self.generator)
@@ -0,0 +1,49 @@
+from ..tensor import tensor
+from ..backend import get_xp
+from ..functional import layer_norm, batch_norm
+from ..nn.modules import Module
+
+
+class LayerNorm(Module):
+    def __init__(self, normalized_shape, eps=1e-5, elementwise_affine=True, *, device='cpu', dtype=None):
+        super().__init__()
+        xp = get_xp(device)
+        self.normalized_shape = (normalized_shape,) if isinstance(normalized_shape, int) else tuple(normalized_shape)
+        self.eps = eps
+        if elementwise_affine:
+            self.weight = tensor(xp.ones(self.normalized_shape), requires_grad=True, device=device, dtype=dtype)
+            self.bias = tensor(xp.zeros(self.normalized_shape), requires_grad=True, device=device, dtype=dtype)
+        else:
+            self.weight = None
+            self.bias = None
+
+    def forward(self, x):
+        return layer_norm(x, self.normalized_shape, self.weight, self.bias, self.eps)
+
+
+class BatchNorm1d(Module):
+    def __init__(self, num_features, eps=1e-5, momentum=0.1, affine=True, track_running_stats=True, *, device='cpu', dtype=None):
+        super().__init__()
+        xp = get_xp(device)
+        self.num_features = num_features
+        self.eps = eps
+        self.momentum = momentum
+        if affine:
+            self.weight = tensor(xp.ones(num_features), requires_grad=True, device=device, dtype=dtype)
+            self.bias = tensor(xp.zeros(num_features), requires_grad=True, device=device, dtype=dtype)
+        else:
+            self.weight = None
+            self.bias = None
+        if track_running_stats:
+            self.register_buffer('running_mean', tensor(xp.zeros(num_features), device=device, dtype=dtype))
+            self.register_buffer('running_var', tensor(xp.ones(num_features), device=device, dtype=dtype))
+        else:
+            self.running_mean = None
+            self.running_var = None
+
+    def forward(self, x):
+        if x.data.ndim not in (2, 3) or x.shape[1] != self.num_features:
+            raise ValueError(f"BatchNorm1d expects input of shape (N, {self.num_features}) or (N, {self.num_features}, L), got {x.shape}")
+        running_mean = None if self.running_mean is None else self.running_mean.data
+        running_var = None if self.running_var is None else self.running_var.data
+        return batch_norm(x, running_mean, running_var, self.weight, self.bias, training=self.training, momentum=self.momentum, eps=self.eps)
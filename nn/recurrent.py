@@ -0,0 +1,118 @@
+from ..tensor import tensor
+from .. import rng
+from ..core.base_fn import nary_op
+from ..functional import linear, stack
+from ..nn.modules import Module
+from ..ops.recurrent_ops import RNNCell, GRUCell, LSTMCell
+
+
+# Shared setup for single-layer recurrent modules. The input projection x @ W_ih + b for
+# every timestep is one matmul; each timestep is then a single fused cell op. With
+# `bptt_window=k` the state is detached every k steps (truncated backprop through time).
+class _Recurrent(Module):
+    n_gates = 1
+
+    def __init__(self, input_size, hidden_size, *, bias=True, batch_first=False, bptt_window=None, device='cpu', dtype=None, generator=None):
+        super().__init__()
+        if bptt_window is not None and bptt_window < 1:
+            raise ValueError(f"bptt_window must be a positive integer, got {bptt_window}")
+        self.input_size = input_size
+        self.hidden_size = hidden_size
+        self.batch_first = batch_first
+        self.bptt_window = bptt_window
+
+        bound = hidden_size ** -0.5
+        size = self.n_gates * hidden_size
+        init = lambda *shape: tensor(rng.uniform(shape, -bound, bound, dtype=dtype, generator=generator, device=device), requires_grad=True, device=device, dtype=dtype)
+        self.weight_ih = init(input_size, size)
+        self.weight_hh = init(hidden_size, size)
+        self.bias_ih = init(size) if bias else None
+
+    def _index(self, t):
+        return (slice(None), t) if self.batch_first else t
+
+    def _sizes(self, x):
+        # (seq_len, batch)
+        return (x.shape[1], x.shape[0]) if self.batch_first else (x.shape[0], x.shape[1])
+
+    def _truncate(self, state, t):
+        if self.bptt_window is not None and t > 0 and t % self.bptt_window == 0:
+            return state.detach()
+        return state
+
+    def _step(self, OpClass, inputs, **kwargs):
+        data, requires_grad, op = nary_op(inputs, OpClass, **kwargs)
+        return tensor(data, requires_grad, parents=list(inputs), op=op, device=inputs[0].device, dtype=data.dtype)
+
+    def _zeros(self, batch, width):
+        xp = self.weight_hh.xp
+        return tensor(xp.zeros((batch, width), dtype=self.weight_hh.dtype), device=self.weight_hh.device)
+
+
+class RNN(_Recurrent):
+    def __init__(self, input_size, hidden_size, *, nonlinearity='tanh', **kwargs):
+        if nonlinearity not in ('tanh', 'relu'):
+            raise ValueError(f"nonlinearity must be 'tanh' or 'relu', got {nonlinearity!r}")
+        super().__init__(input_size, hidden_size, **kwargs)
+        self.nonlinearity = nonlinearity
+
+    def forward(self, x, hx=None):
+        seq_len, batch = self._sizes(x)
+        proj = linear(x, self.weight_ih, self.bias_ih)
+        h = hx if hx is not None else self._zeros(batch, self.hidden_size)
+        outputs = []
+        for t in range(seq_len):
+            h = self._truncate(h, t)
+            h = self._step(RNNCell, (proj, h, self.weight_hh), index=self._index(t), nonlinearity=self.nonlinearity)
+            outputs.append(h)
+        return stack(outputs, axis=1 if self.batch_first else 0), h
+
+
+class GRU(_Recurrent):
+    n_gates = 3
+
+    def __init__(self, input_size, hidden_size, *, bias=True, generator=None, **kwargs):
+        super().__init__(input_size, hidden_size, bias=bias, generator=generator, **kwargs)
+        # The candidate gate needs its hidden-side bias separately (it is scaled by r)
+        bound = hidden_size ** -0.5
+        self.bias_hh = tensor(
+            rng.uniform((3 * hidden_size,), -bound, bound, dtype=self.weight_hh.dtype, generator=generator, device=self.weight_hh.device),
+            requires_grad=True, device=self.weight_hh.device, dtype=self.weight_hh.dtype,
+        ) if bias else None
+
+    def forward(self, x, hx=None):
+        seq_len, batch = self._sizes(x)
+        proj = linear(x, self.weight_ih, self.bias_ih)
+        h = hx if hx is not None else self._zeros(batch, self.hidden_size)
+        outputs = []
+        for t in range(seq_len):
+            h = self._truncate(h, t)
+            inputs = (proj, h, self.weight_hh) if self.bias_hh is None else (proj, h, self.weight_hh, self.bias_hh)
+            h = self._step(GRUCell, inputs, index=self._index(t))
+            outputs.append(h)
+        return stack(outputs, axis=1 if self.batch_first else 0), h
+
+
+class LSTM(_Recurrent):
+    n_gates = 4
+
+    def forward(self, x, hx=None):
+        """
+        Returns (output, (h_n, c_n)). Gradients flow back into an initial `hx=(h_0, c_0)`;
+        pass detached states when carrying them across batches.
+        """
+        seq_len, batch = self._sizes(x)
+        H = self.hidden_size
+        proj = linear(x, self.weight_ih, self.bias_ih)
+        if hx is None:
+            state = self._zeros(batch, 2 * H)
+        else:
+            # [h_0, c_0] side by side, built from tensor ops so h_0 and c_0 receive gradients
+            state = stack(hx, axis=-2).reshape(batch, 2 * H)
+        states = []
+        for t in range(seq_len):
+            state = self._truncate(state, t)
+            state = self._step(LSTMCell, (proj, state, self.weight_hh), index=self._index(t))
+            states.append(state)
+        output = stack(states, axis=1 if self.batch_first else 0)[..., :H]
+        return output, (state[:, :H], state[:, H:])
@@ -1,4 +1,5 @@
 from .base import Operation
+from .. import rng
 
 
 # Sigmoid operation
@@ -18,3 +19,26 @@ class ReLU(Operation):
 
     def backward(self, grad, x):
         return (grad.data * self.mask,)
+
+# Inverted dropout. The keep mask is drawn in bulk from the generator and kept
+# bit-packed (1 bit per element) until backward.
+class Dropout(Operation):
+    def __init__(self, p=0.5, generator=None):
+        self.p = p
+        self.generator = generator
+
+    def forward(self, x):
+        xp = x.xp
+        self.scale = 1.0 / (1.0 - self.p)
+        mask = rng.bernoulli(x.data.shape, 1.0 - self.p, generator=self.generator, device=x.device)
+        self.packed_mask = xp.packbits(mask, axis=None)
+        out = x.data * mask
+        out *= x.data.dtype.type(self.scale)
+        return out
+
+    def backward(self, grad, x):
+        xp = x.xp
+        mask = xp.unpackbits(self.packed_mask, count=x.data.size).reshape(x.data.shape)
+        out = grad.data * mask
+        out *= grad.data.dtype.type(self.scale)
+        return (out,)
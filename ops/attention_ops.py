@@ -0,0 +1,68 @@
+from .base import Operation
+
+
+# Scaled dot-product attention computed over blocks of keys with an online softmax.
+# Only a (Lq, block) slice of the score matrix exists at any time; forward keeps the
+# output and the per-row logsumexp, and backward recomputes each block's probabilities
+# from them. q: (..., Lq, d), k: (..., Lk, d), v: (..., Lk, dv) with equal leading dims.
+class ScaledDotProductAttention(Operation):
+    def __init__(self, causal=False, scale=None, block_size=128):
+        self.causal = causal
+        self.scale = scale
+        self.block_size = block_size
+
+    def _blocks(self, n_queries, n_keys):
+        # Causal attention is top-left aligned: query i sees keys 0..i, so key blocks
+        # starting at or after n_queries are skipped entirely
+        stop = min(n_keys, n_queries) if self.causal else n_keys
+        for start in range(0, stop, self.block_size):
+            yield start, min(start + self.block_size, n_keys)
+
+    def _scores(self, xp, q, k_block, start, stop):
+        s = (q @ xp.swapaxes(k_block, -1, -2)) * self.scale
+        if self.causal:
+            rows = xp.arange(q.shape[-2])[:, None]
+            cols = xp.arange(start, stop)[None, :]
+            s = xp.where(cols > rows, -xp.inf, s)
+        return s
+
+    def forward(self, q, k, v):
+        xp = q.xp
+        q, k, v = q.data, k.data, v.data
+        if self.scale is None:
+            self.scale = 1.0 / (q.shape[-1] ** 0.5)
+
+        lead = q.shape[:-1]
+        row_max = xp.full(lead, -xp.inf, dtype=q.dtype)
+        row_sum = xp.zeros(lead, dtype=q.dtype)
+        acc = xp.zeros(lead + (v.shape[-1],), dtype=xp.result_type(q, v))
+        for start, stop in self._blocks(q.shape[-2], k.shape[-2]):
+            s = self._scores(xp, q, k[..., start:stop, :], start, stop)
+            new_max = xp.maximum(row_max, s.max(axis=-1))
+            correction = xp.exp(row_max - new_max)
+            p = xp.exp(s - new_max[..., None])
+            row_sum = row_sum * correction + p.sum(axis=-1)
+            acc = acc * correction[..., None] + p @ v[..., start:stop, :]
+            row_max = new_max
+
+        self.out = acc / row_sum[..., None]
+        self.logsumexp = row_max + xp.log(row_sum)
+        return self.out
+
+    def backward(self, grad, q, k, v):
+        xp = q.xp
+        q, k, v = q.data, k.data, v.data
+        d_out = grad.data
+        delta = (d_out * self.out).sum(axis=-1, keepdims=True)
+
+        d_q = xp.zeros_like(q)
+        d_k = xp.zeros_like(k)
+        d_v = xp.zeros_like(v)
+        for start, stop in self._blocks(q.shape[-2], k.shape[-2]):
+            k_block, v_block = k[..., start:stop, :], v[..., start:stop, :]
+            p = xp.exp(self._scores(xp, q, k_block, start, stop) - self.logsumexp[..., None])
+            d_v[..., start:stop, :] = xp.swapaxes(p, -1, -2) @ d_out
+            d_s = p * (d_out @ xp.swapaxes(v_block, -1, -2) - delta) * self.scale
+            d_q += d_s @ k_block
+            d_k[..., start:stop, :] = xp.swapaxes(d_s, -1, -2) @ q
+        return d_q, d_k, d_v
@@ -1,7 +1,38 @@
+from ..backend import get_backend
+from ..core import per_sample
+
+
 # Operation base class
 class Operation:
     def forward(self, *inputs):
         raise NotImplementedError
 
     def backward(self, grad, *inputs):
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    # Gradient w.r.t. inputs[index] with the leading (batch) axis of grad kept
+    def grad_sample(self, grad, index, *inputs):
+        raise NotImplementedError(f"{type(self).__name__} does not support per-sample gradients")
+
+    # Dispatch through the backend of the first input. A kernel registered under the
+    # operation's class name takes precedence over the default forward/backward.
+    def apply(self, *inputs):
+        self._kernel = get_backend(inputs[0].device).get_kernel(type(self).__name__)
+        if self._kernel is not None and self._kernel.forward is not None:
+            return self._kernel.forward(self, *inputs)
+        return self.forward(*inputs)
+
+    def apply_backward(self, grad, *inputs):
+        # Reuse the kernel chosen at forward time so a pack swapped in between
+        # forward and backward cannot pair mismatched halves
+        kernel = getattr(self, "_kernel", None)
+        if kernel is not None and kernel.backward is not None:
+            grads = kernel.backward(self, grad, *inputs)
+        else:
+            grads = self.backward(grad, *inputs)
+
+        if per_sample.active():
+            for index, x in enumerate(inputs):
+                if per_sample.is_tracked(x):
+                    per_sample.accumulate(x, self.grad_sample(grad, index, *inputs))
+        return grads
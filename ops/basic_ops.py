@@ -1,5 +1,5 @@
 from .base import Operation
-from ..core.utils import unbroadcast, expand_grad
+from ..core.utils import unbroadcast, unbroadcast_per_sample, expand_grad, reduced_axes, IndexedGrad
 
 class Neg(Operation):
     def forward(self, x):
@@ -20,6 +20,9 @@ class Add(Operation):
         grad_b = unbroadcast(grad.data, self.b_shape)
         return grad_a, grad_b
 
+    def grad_sample(self, grad, index, a, b):
+        return unbroadcast_per_sample(grad.data, (self.a_shape, self.b_shape)[index])
+
 # Subtraction operation
 class Subtract(Operation):
     def forward(self, a, b):
@@ -32,6 +35,11 @@ class Subtract(Operation):
         grad_b = unbroadcast(-grad.data, self.b_shape)
         return grad_a, grad_b
 
+    def grad_sample(self, grad, index, a, b):
+        if index == 0:
+            return unbroadcast_per_sample(grad.data, self.a_shape)
+        return unbroadcast_per_sample(-grad.data, self.b_shape)
+
 # Element-wise multiplication
 class Multiply(Operation):
     def forward(self, a, b):
@@ -46,6 +54,11 @@ class Multiply(Operation):
         grad_b = unbroadcast(grad.data * a.data, self.b_shape)
         return grad_a, grad_b
 
+    def grad_sample(self, grad, index, a, b):
+        if index == 0:
+            return unbroadcast_per_sample(grad.data * b.data, self.a_shape)
+        return unbroadcast_per_sample(grad.data * a.data, self.b_shape)
+
 # Element-wise division
 class Divide(Operation):
     def forward(self, a, b):
@@ -59,6 +72,11 @@ class Divide(Operation):
         grad_a = unbroadcast(grad.data / b.data, self.a_shape)
         grad_b = unbroadcast(-grad.data * a.data / (b.data ** 2), self.b_shape)
         return grad_a, grad_b
+
+    def grad_sample(self, grad, index, a, b):
+        if index == 0:
+            return unbroadcast_per_sample(grad.data / b.data, self.a_shape)
+        return unbroadcast_per_sample(-grad.data * a.data / (b.data ** 2), self.b_shape)
     
 class Pow(Operation):
     def forward(self, a, b):
@@ -88,25 +106,79 @@ class MatMul(Operation):
         self.a_data = a_data
         self.b_data = b_data
 
+        # Leading (batch) dimensions broadcast as in numpy.matmul
         result = a_data @ b_data
+        self.out_shape = result.shape
+        # Drop the axes inserted for 1-D operands, as numpy.matmul does; backward
+        # restores them by reshaping the gradient to out_shape
+        if a.data.ndim == 1 and b.data.ndim == 1:
+            return result.reshape(result.shape[:-2])
+        if a.data.ndim == 1:
+            return result.reshape(result.shape[:-2] + result.shape[-1:])
+        if b.data.ndim == 1:
+            return result.reshape(result.shape[:-1])
         return result
 
     def backward(self, grad, a, b):
-        grad_data = grad.data
-        if grad_data.ndim == 0:
-            grad_data = grad_data.reshape(1, 1)
-        elif grad_data.ndim == 1:
-            grad_data = grad_data.reshape(-1, 1) if self.b_data.shape[1] == 1 else grad_data.reshape(1, -1)
+        xp = a.xp
+        grad_data = grad.data.reshape(self.out_shape)
 
-        grad_a = grad_data @ self.b_data.T
-        grad_b = self.a_data.T @ grad_data
+        grad_a = grad_data @ xp.swapaxes(self.b_data, -1, -2)
+        grad_b = xp.swapaxes(self.a_data, -1, -2) @ grad_data
 
-        # Reshape gradients to match original input shapes
-        grad_a = grad_a.reshape(self.a_shape)
-        grad_b = grad_b.reshape(self.b_shape)
+        # Sum over broadcast batch dimensions, then restore original input shapes
+        grad_a = unbroadcast(grad_a, self.a_data.shape).reshape(self.a_shape)
+        grad_b = unbroadcast(grad_b, self.b_data.shape).reshape(self.b_shape)
 
         return grad_a, grad_b    
 
+    # Per-sample gradient of the right operand (x @ W): one outer product per example
+    def grad_sample(self, grad, index, a, b):
+        if index != 1 or len(self.a_shape) < 2 or len(self.b_shape) != 2:
+            raise NotImplementedError("MatMul per-sample gradients require a batched left operand and a 2-D right operand")
+        xp = a.xp
+        n = self.a_shape[0]
+        a_data = a.data.reshape(n, -1, self.a_shape[-1])
+        grad_data = grad.data.reshape(n, -1, self.b_shape[-1])
+        return xp.einsum('nti,nto->nio', a_data, grad_data)
+
+# Fused matmul with bias: x @ weight + bias
+class Linear(Operation):
+    def forward(self, x, weight, bias):
+        self.x_shape = x.data.shape
+        return x.data @ weight.data + bias.data
+
+    def backward(self, grad, x, weight, bias):
+        grad_data = grad.data
+        x_data = x.data.reshape(-1, x.data.shape[-1])
+        grad_2d = grad_data.reshape(-1, grad_data.shape[-1])
+        grad_x = (grad_data @ weight.data.T).reshape(self.x_shape)
+        grad_w = x_data.T @ grad_2d
+        grad_b = grad_2d.sum(axis=0)
+        return grad_x, grad_w, grad_b
+
+    def grad_sample(self, grad, index, x, weight, bias):
+        if index == 0 or len(self.x_shape) < 2:
+            raise NotImplementedError("Linear per-sample gradients require a batched input and are only defined for weight and bias")
+        n = self.x_shape[0]
+        grad_data = grad.data.reshape(n, -1, grad.data.shape[-1])
+        if index == 2:
+            return grad_data.sum(axis=1)
+        x_data = x.data.reshape(n, -1, self.x_shape[-1])
+        return x.xp.einsum('nti,nto->nio', x_data, grad_data)
+
+
+# Stack N tensors along a new axis
+class Stack(Operation):
+    def __init__(self, axis=0):
+        self.axis = axis
+
+    def forward(self, *inputs):
+        return inputs[0].xp.stack([x.data for x in inputs], axis=self.axis)
+
+    def backward(self, grad, *inputs):
+        return tuple(inputs[0].xp.moveaxis(grad.data, self.axis, 0))
+
 
 # Transpose operation
 class Transpose(Operation):
@@ -137,9 +209,7 @@ class GetItem(Operation):
         return x.data[self.idx]
 
     def backward(self, grad, x):
-        grad_data = x.xp.zeros_like(x.data)
-        grad_data[self.idx] = grad.data
-        return (grad_data,)
+        return (IndexedGrad(self.idx, grad.data),)
     
 # Sum operation
 class Sum(Operation):
@@ -151,11 +221,7 @@ class Sum(Operation):
         return x.data.sum(axis=self.axis, keepdims=self.keepdims)
 
     def backward(self, grad, x):
-        if self.axis is None and not self.keepdims:
-            grad.data = grad.data.reshape(1).repeat(x.data.size, axis=0).reshape(x.data.shape)
-        elif self.axis is not None and not self.keepdims:
-            grad.data = expand_grad(grad, x.shape, self.axis)
-        return (grad.data,)
+        return (expand_grad(x.xp, grad.data, x.data.shape, self.axis, self.keepdims),)
 
 # Mean operation
 class Mean(Operation):
@@ -167,13 +233,10 @@ class Mean(Operation):
         return x.data.mean(axis=self.axis, keepdims=self.keepdims)
 
     def backward(self, grad, x):
-        count = x.data.size if self.axis is None else x.shape[self.axis]
-        grad.data = grad.data / count
-        if self.axis is None and not self.keepdims:
-            grad.data = grad.data.reshape(1).repeat(x.data.size, axis=0).reshape(x.data.shape)
-        elif self.axis is not None and not self.keepdims:
-            grad.data = expand_grad(grad, x.data.shape, self.axis)
-        return (grad.data,)
+        count = 1
+        for ax in reduced_axes(self.axis, x.data.ndim):
+            count *= x.data.shape[ax]
+        return (expand_grad(x.xp, grad.data / count, x.data.shape, self.axis, self.keepdims),)
     
 # Scalar addition operation (scalar + tensor or tensor + scalar)
 class ScalarAdd(Operation):
@@ -0,0 +1,133 @@
+from .base import Operation
+from ..core.workspace import Workspace
+
+
+# 2-D convolution and max pooling over NCHW inputs. Sliding windows are taken as an
+# `as_strided` view of the (padded) input and copied once into a workspace buffer laid
+# out as (N, OH, OW, C, kh, kw), so the convolution is a single (N*OH*OW, C*kh*kw) matmul.
+# Backward scatter-adds window gradients back onto the input with one strided add per
+# kernel offset (col2im). Scratch buffers come from a per-layer Workspace and are reused
+# across steps once the op that holds them has run backward or been collected.
+
+def _out_size(size, kernel, stride, padding):
+    return (size + 2 * padding - kernel) // stride + 1
+
+
+def _pad(xp, data, padding, workspace, owner, fill):
+    ph, pw = padding
+    if ph == 0 and pw == 0:
+        return data
+    N, C, H, W = data.shape
+    padded = workspace.get(xp, f"padded_{fill}", (N, C, H + 2 * ph, W + 2 * pw), data.dtype, owner, fill=fill)
+    padded[:, :, ph:ph + H, pw:pw + W] = data
+    return padded
+
+
+def _windows(xp, padded, kernel, stride, out_hw, channels_last):
+    # Read-only view of every sliding window, no copy
+    (kh, kw), (sh, sw), (OH, OW) = kernel, stride, out_hw
+    sN, sC, sH, sW = padded.strides
+    N, C = padded.shape[:2]
+    if channels_last:
+        shape, strides = (N, OH, OW, C, kh, kw), (sN, sH * sh, sW * sw, sC, sH, sW)
+    else:
+        shape, strides = (N, C, OH, OW, kh, kw), (sN, sC, sH * sh, sW * sw, sH, sW)
+    return xp.lib.stride_tricks.as_strided(padded, shape=shape, strides=strides, writeable=False)
+
+
+def _col2im(xp, offset_grad, input_shape, dtype, kernel, stride, padding, out_hw):
+    """
+    Scatter-add window gradients back onto an (N, C, H, W) input. `offset_grad(i, j)` gives
+    the (N, C, OH, OW) gradient at kernel offset (i, j); each offset is one strided add, so
+    overlapping windows accumulate correctly.
+    """
+    (kh, kw), (sh, sw), (ph, pw), (OH, OW) = kernel, stride, padding, out_hw
+    N, C, H, W = input_shape
+    dx = xp.zeros((N, C, H + 2 * ph, W + 2 * pw), dtype=dtype)
+    for i in range(kh):
+        for j in range(kw):
+            dx[:, :, i:i + sh * (OH - 1) + 1:sh, j:j + sw * (OW - 1) + 1:sw] += offset_grad(i, j)
+    return dx[:, :, ph:ph + H, pw:pw + W]
+
+
+class Conv2d(Operation):
+    def __init__(self, stride=(1, 1), padding=(0, 0), workspace=None):
+        self.stride = stride
+        self.padding = padding
+        self.workspace = workspace if workspace is not None else Workspace()
+
+    def forward(self, x, weight, bias=None):
+        xp = x.xp
+        data, w = x.data, weight.data
+        N, C, H, W = data.shape
+        F, _, kh, kw = w.shape
+        self.kernel = (kh, kw)
+        self.out_hw = (_out_size(H, kh, self.stride[0], self.padding[0]), _out_size(W, kw, self.stride[1], self.padding[1]))
+        OH, OW = self.out_hw
+
+        dtype = xp.result_type(data, w)
+        padded = _pad(xp, data.astype(dtype, copy=False), self.padding, self.workspace, self, 0)
+        self.cols = self.workspace.get(xp, "cols", (N, OH, OW, C, kh, kw), dtype, self)
+        xp.copyto(self.cols, _windows(xp, padded, self.kernel, self.stride, self.out_hw, channels_last=True))
+
+        out = self.cols.reshape(N * OH * OW, C * kh * kw) @ w.reshape(F, -1).T
+        if bias is not None:
+            out += bias.data
+        return out.reshape(N, OH, OW, F).transpose(0, 3, 1, 2)
+
+    def backward(self, grad, x, weight, bias=None):
+        xp = x.xp
+        N, C, H, W = x.data.shape
+        F = weight.data.shape[0]
+        kh, kw = self.kernel
+        OH, OW = self.out_hw
+
+        g = grad.data.transpose(0, 2, 3, 1).reshape(N * OH * OW, F)
+        cols = self.cols.reshape(N * OH * OW, C * kh * kw)
+        d_weight = (g.T @ cols).reshape(weight.data.shape)
+        d_cols = (g @ weight.data.reshape(F, -1)).reshape(N, OH, OW, C, kh, kw).transpose(0, 3, 1, 2, 4, 5)
+        d_x = _col2im(xp, lambda i, j: d_cols[..., i, j], (N, C, H, W), d_cols.dtype, self.kernel, self.stride, self.padding, self.out_hw)
+
+        self.workspace.release(self)
+        self.cols = None
+        if bias is None:
+            return d_x, d_weight
+        return d_x, d_weight, g.sum(axis=0)
+
+
+# Only the argmax offset within each window is kept for backward, stored in the
+# smallest unsigned dtype that holds kh*kw.
+class MaxPool2d(Operation):
+    def __init__(self, kernel_size=(2, 2), stride=None, padding=(0, 0), workspace=None):
+        self.kernel = kernel_size
+        self.stride = stride if stride is not None else kernel_size
+        self.padding = padding
+        self.workspace = workspace if workspace is not None else Workspace()
+
+    def forward(self, x):
+        xp = x.xp
+        data = x.data
+        N, C, H, W = data.shape
+        kh, kw = self.kernel
+        self.out_hw = (_out_size(H, kh, self.stride[0], self.padding[0]), _out_size(W, kw, self.stride[1], self.padding[1]))
+        OH, OW = self.out_hw
+
+        # Padding must never win the max; integer arrays have no -inf
+        fill = xp.iinfo(data.dtype).min if xp.issubdtype(data.dtype, xp.integer) else -xp.inf
+        padded = _pad(xp, data, self.padding, self.workspace, self, fill)
+        windows = self.workspace.get(xp, "windows", (N, C, OH, OW, kh, kw), data.dtype, self)
+        xp.copyto(windows, _windows(xp, padded, self.kernel, self.stride, self.out_hw, channels_last=False))
+        windows = windows.reshape(N, C, OH, OW, kh * kw)
+
+        argmax = windows.argmax(axis=-1)
+        out = xp.take_along_axis(windows, argmax[..., None], axis=-1)[..., 0]
+        self.argmax = argmax.astype(xp.min_scalar_type(kh * kw - 1))
+        self.workspace.release(self)
+        return out
+
+    def backward(self, grad, x):
+        xp = x.xp
+        g = grad.data
+        kw = self.kernel[1]
+        routed = lambda i, j: xp.where(self.argmax == i * kw + j, g, 0)
+        return (_col2im(xp, routed, x.data.shape, g.dtype, self.kernel, self.stride, self.padding, self.out_hw),)
@@ -0,0 +1,135 @@
+import collections
+import string
+import threading
+
+from .base import Operation
+
+
+# Contraction plans keyed by (subscripts, operand shapes). A plan holds the parsed
+# subscripts plus the optimized contraction path for the forward pass and for the
+# gradient of every operand, so einsum_path only runs once per signature. The cache
+# keeps the most recently used signatures, so varying shapes cannot grow it without bound.
+_PLAN_CACHE_SIZE = 256
+_plan_cache = collections.OrderedDict()
+_plan_lock = threading.Lock()
+
+
+def _parse(subscripts, shapes):
+    subscripts = subscripts.replace(" ", "")
+    if "->" in subscripts:
+        lhs, out = subscripts.split("->")
+    else:
+        lhs, out = subscripts, None
+    terms = lhs.split(",")
+    if len(terms) != len(shapes):
+        raise ValueError(f"einsum subscripts {subscripts!r} expect {len(terms)} operands, got {len(shapes)}")
+
+    # Expand '...' into explicit labels, right aligned across operands
+    used = set(subscripts)
+    spare = [c for c in string.ascii_letters if c not in used]
+    n_ellipsis = max((len(shape) - len(term.replace("...", "")) for term, shape in zip(terms, shapes) if "..." in term), default=0)
+    ellipsis_labels = "".join(spare[:n_ellipsis])
+    expanded = []
+    for term, shape in zip(terms, shapes):
+        if "..." in term:
+            n = len(shape) - len(term.replace("...", ""))
+            term = term.replace("...", ellipsis_labels[n_ellipsis - n:])
+        if len(term) != len(shape):
+            raise ValueError(f"einsum term {term!r} does not match operand of shape {shape}")
+        expanded.append(term)
+
+    if out is None:
+        counts = {}
+        for term in expanded:
+            for label in term:
+                counts[label] = counts.get(label, 0) + 1
+        out = ellipsis_labels + "".join(sorted(l for l, c in counts.items() if c == 1 and l not in ellipsis_labels))
+    else:
+        out = out.replace("...", ellipsis_labels)
+
+    sizes = {}
+    for term, shape in zip(expanded, shapes):
+        for label, size in zip(term, shape):
+            if size != 1 or label not in sizes:
+                sizes[label] = max(sizes.get(label, 1), size)
+    return expanded, out, sizes
+
+
+def _dummy(xp, shape):
+    # Zero-memory stand-in: einsum_path only looks at shapes
+    return xp.broadcast_to(xp.empty((), dtype=xp.float64), shape)
+
+
+def _get_plan(xp, subscripts, shapes):
+    key = (subscripts, shapes)
+    with _plan_lock:
+        plan = _plan_cache.get(key)
+        if plan is not None:
+            _plan_cache.move_to_end(key)
+            return plan
+
+    terms, out, sizes = _parse(subscripts, shapes)
+    forward_expr = ",".join(terms) + "->" + out
+    forward_path = xp.einsum_path(forward_expr, *(_dummy(xp, s) for s in shapes), optimize='optimal')[0]
+
+    backward = []
+    out_shape = tuple(sizes[l] for l in out)
+    for i, (term, shape) in enumerate(zip(terms, shapes)):
+        if len(set(term)) != len(term):
+            backward.append(None)  # repeated labels (diagonals) are not differentiable here
+            continue
+        others = [t for j, t in enumerate(terms) if j != i]
+        available = set(out).union(*others)
+        # Labels of this operand that are either summed only here or broadcast from size 1
+        # are dropped from the contraction and restored by reshape/broadcast afterwards
+        target = "".join(l for l, s in zip(term, shape) if l in available and s == sizes[l])
+        expr = ",".join([out] + others) + "->" + target
+        other_shapes = [s for j, s in enumerate(shapes) if j != i]
+        path = xp.einsum_path(expr, _dummy(xp, out_shape), *(_dummy(xp, s) for s in other_shapes), optimize='optimal')[0]
+        # A kept label seen only with size 1 elsewhere (broadcast against this operand)
+        # contracts to size 1 as well; the final broadcast restores it
+        seen = {l: sizes[l] for l in out}
+        for t, s in zip(others, other_shapes):
+            for l, n in zip(t, s):
+                seen[l] = max(seen.get(l, 1), n)
+        keep_shape = tuple(seen[l] if l in target else 1 for l in term)
+        backward.append((expr, path, keep_shape))
+
+    plan = (forward_expr, forward_path, backward)
+    with _plan_lock:
+        _plan_cache[key] = plan
+        if len(_plan_cache) > _PLAN_CACHE_SIZE:
+            _plan_cache.popitem(last=False)
+    return plan
+
+
+class Einsum(Operation):
+    def __init__(self, subscripts):
+        self.subscripts = subscripts
+
+    def forward(self, *operands):
+        xp = operands[0].xp
+        self.shapes = tuple(x.data.shape for x in operands)
+        self.plan = _get_plan(xp, self.subscripts, self.shapes)
+        forward_expr, forward_path, backward = self.plan
+        # Fail before the graph is built rather than when backward reaches this op
+        for x, step in zip(operands, backward):
+            if step is None and x.requires_grad:
+                raise NotImplementedError(f"einsum backward does not support repeated labels in an operand: {self.subscripts!r}")
+        return xp.einsum(forward_expr, *(x.data for x in operands), optimize=forward_path)
+
+    def backward(self, grad, *operands):
+        xp = operands[0].xp
+        grads = []
+        for i, x in enumerate(operands):
+            if not x.requires_grad:
+                grads.append(None)
+                continue
+            step = self.plan[2][i]
+            if step is None:
+                raise NotImplementedError(f"einsum backward does not support repeated labels in an operand: {self.subscripts!r}")
+            expr, path, keep_shape = step
+            others = [o.data for j, o in enumerate(operands) if j != i]
+            g = xp.einsum(expr, grad.data, *others, optimize=path).reshape(keep_shape)
+            grads.append(xp.broadcast_to(g, self.shapes[i]))
+        return tuple(grads)
@@ -0,0 +1,157 @@
+import string
+
+from .base import Operation
+
+
+def _moments(xp, x, axes):
+    """
+    Mean, centred input and biased variance over `axes`. The variance is reduced from
+    the centred values (which x_hat needs anyway) rather than as E[x^2] - E[x]^2, which
+    cancels catastrophically when the mean is large relative to the spread. The mean is
+    summed after shifting by the first element of each slice, so its rounding error
+    scales with the spread rather than with the offset.
+    """
+    letters = string.ascii_letters[:x.ndim]
+    kept = "".join(l for i, l in enumerate(letters) if i not in axes)
+    count = 1
+    for ax in axes:
+        count *= x.shape[ax]
+    pivot = x[tuple(slice(0, 1) if i in axes else slice(None) for i in range(x.ndim))]
+    centered = x - pivot
+    shift = centered.sum(axis=axes) / count
+    centered -= _expand(shift, axes)
+    var = xp.einsum(f"{letters},{letters}->{kept}", centered, centered) / count
+    return pivot.reshape(shift.shape) + shift, centered, var, count
+
+
+def _expand(a, axes):
+    # Reinsert reduced axes as size-1 dims so `a` broadcasts against the input
+    shape = list(a.shape)
+    for ax in sorted(axes):
+        shape.insert(ax, 1)
+    return a.reshape(shape)
+
+
+def _affine_shape(axes, shape):
+    # weight/bias of shape (features,) broadcast along the kept (feature) axis
+    return tuple(1 if i in axes else s for i, s in enumerate(shape))
+
+
+# Shared pieces of the fused normalizations. Only x_hat and inv_std are kept for
+# backward. Weight and bias are optional trailing inputs, either or both may be absent;
+# `has_weight`/`has_bias` say which ones were passed. A scalar weight or bias applies
+# to every feature.
+class _Normalize(Operation):
+    def _split(self, params):
+        params = list(params)
+        weight = params.pop(0) if self.has_weight else None
+        bias = params.pop(0) if self.has_bias else None
+        return weight, bias
+
+    def _normalize(self, centered, inv_std, axes):
+        # `centered` is always a fresh array, so it is scaled in place
+        centered *= _expand(inv_std, axes)
+        self.x_hat = centered
+        self.inv_std = inv_std
+
+    @staticmethod
+    def _broadcastable(param, param_shape):
+        return param.data.reshape(param_shape) if param.data.ndim else param.data
+
+    def _affine(self, x_hat, weight, bias, param_shape):
+        out = x_hat
+        if weight is not None:
+            out = out * self._broadcastable(weight, param_shape)
+        if bias is not None:
+            out = out + self._broadcastable(bias, param_shape)
+        return out
+
+    @staticmethod
+    def _reduce(g, param, axes):
+        # A scalar weight or bias collects the gradient of every feature
+        return g.sum(axis=axes).reshape(param.data.shape) if param.data.ndim else g.sum()
+
+    def _param_grads(self, g, weight, bias, param_shape, axes):
+        grads = []
+        if weight is not None:
+            grads.append(self._reduce(g * self.x_hat, weight, axes))
+        if bias is not None:
+            grads.append(self._reduce(g, bias, axes))
+        return grads
+
+
+class LayerNorm(_Normalize):
+    def __init__(self, n_dims, eps=1e-5, has_weight=True, has_bias=True):
+        self.n_dims = n_dims
+        self.eps = eps
+        self.has_weight = has_weight
+        self.has_bias = has_bias
+
+    def forward(self, x, *params):
+        weight, bias = self._split(params)
+        xp = x.xp
+        data = x.data
+        self.axes = tuple(range(data.ndim - self.n_dims, data.ndim))
+        _, centered, var, self.count = _moments(xp, data, self.axes)
+        self._normalize(centered, 1 / xp.sqrt(var + self.eps), self.axes)
+        self.param_shape = data.shape[data.ndim - self.n_dims:]
+        return self._affine(self.x_hat, weight, bias, self.param_shape)
+
+    def backward(self, grad, x, *params):
+        weight, bias = self._split(params)
+        g = grad.data
+        lead = tuple(range(g.ndim - self.n_dims))
+        g_hat = g * self._broadcastable(weight, self.param_shape) if weight is not None else g
+        # dx = inv_std * (g_hat - mean(g_hat) - x_hat * mean(g_hat * x_hat)) over normalized axes
+        mean_g = g_hat.sum(axis=self.axes, keepdims=True) / self.count
+        mean_gx = (g_hat * self.x_hat).sum(axis=self.axes, keepdims=True) / self.count
+        dx = (g_hat - mean_g - self.x_hat * mean_gx) * _expand(self.inv_std, self.axes)
+        return (dx, *self._param_grads(g, weight, bias, self.param_shape, lead))
+
+
+# BatchNorm over every axis except the feature axis 1: (N, C) or (N, C, L).
+# In training mode batch statistics are used and the running estimates are updated
+# in place; in eval mode the running estimates are used as constants.
+class BatchNorm(_Normalize):
+    def __init__(self, running_mean=None, running_var=None, training=True, momentum=0.1, eps=1e-5, has_weight=True, has_bias=True):
+        self.running_mean = running_mean
+        self.running_var = running_var
+        self.training = training
+        self.momentum = momentum
+        self.eps = eps
+        self.has_weight = has_weight
+        self.has_bias = has_bias
+
+    def forward(self, x, *params):
+        weight, bias = self._split(params)
+        xp = x.xp
+        data = x.data
+        self.axes = (0,) + tuple(range(2, data.ndim))
+        self.param_shape = _affine_shape(self.axes, data.shape)
+        if self.training or self.running_mean is None:
+            mean, centered, var, self.count = _moments(xp, data, self.axes)
+            if self.running_mean is not None:
+                unbiased = var * (self.count / max(self.count - 1, 1))
+                self.running_mean *= 1 - self.momentum
+                self.running_mean += self.momentum * mean
+                self.running_var *= 1 - self.momentum
+                self.running_var += self.momentum * unbiased
+            self.use_batch_stats = True
+        else:
+            centered, var = data - _expand(self.running_mean, self.axes), self.running_var
+            self.use_batch_stats = False
+        self._normalize(centered, 1 / xp.sqrt(var + self.eps), self.axes)
+        return self._affine(self.x_hat, weight, bias, self.param_shape)
+
+    def backward(self, grad, x, *params):
+        weight, bias = self._split(params)
+        g = grad.data
+        g_hat = g * self._broadcastable(weight, self.param_shape) if weight is not None else g
+        inv_std = _expand(self.inv_std, self.axes)
+        if self.use_batch_stats:
+            mean_g = g_hat.sum(axis=self.axes, keepdims=True) / self.count
+            mean_gx = (g_hat * self.x_hat).sum(axis=self.axes, keepdims=True) / self.count
+            dx = (g_hat - mean_g - self.x_hat * mean_gx) * inv_std
+        else:
+            dx = g_hat * inv_std
+        return (dx, *self._param_grads(g, weight, bias, self.param_shape, self.axes))
@@ -0,0 +1,112 @@
+from .base import Operation
+from ..core.utils import IndexedGrad
+
+
+# Fused recurrent cells. Each op is one timestep: it reads its slice `index` of the
+# input projection (computed for all timesteps by a single matmul beforehand), combines
+# it with the previous state, and hands the projection gradient back as an IndexedGrad
+# so the engine accumulates every timestep into one buffer.
+
+def _sigmoid(xp, x):
+    return 1 / (1 + xp.exp(-x))
+
+
+class RNNCell(Operation):
+    def __init__(self, index, nonlinearity='tanh'):
+        self.index = index
+        self.nonlinearity = nonlinearity
+
+    def forward(self, proj, h_prev, weight_hh):
+        xp = proj.xp
+        pre = proj.data[self.index] + h_prev.data @ weight_hh.data
+        if self.nonlinearity == 'tanh':
+            self.h = xp.tanh(pre)
+        else:
+            self.h = xp.maximum(pre, 0)
+        return self.h
+
+    def backward(self, grad, proj, h_prev, weight_hh):
+        if self.nonlinearity == 'tanh':
+            d_pre = grad.data * (1 - self.h * self.h)
+        else:
+            d_pre = grad.data * (self.h > 0)
+        return (
+            IndexedGrad(self.index, d_pre),
+            d_pre @ weight_hh.data.T,
+            h_prev.data.T @ d_pre,
+        )
+
+
+# Gate layout (r, z, n) along the last axis, as in PyTorch:
+#   r = σ(p_r + h W_r + b_r),  z = σ(p_z + h W_z + b_z),  n = tanh(p_n + r * (h W_n + b_n))
+#   h' = (1 - z) * n + z * h
+# The hidden-side bias b is optional.
+class GRUCell(Operation):
+    def __init__(self, index):
+        self.index = index
+
+    def forward(self, proj, h_prev, weight_hh, bias_hh=None):
+        xp = proj.xp
+        p = proj.data[self.index]
+        gh = h_prev.data @ weight_hh.data
+        if bias_hh is not None:
+            gh = gh + bias_hh.data
+        p_r, p_z, p_n = xp.split(p, 3, axis=-1)
+        gh_r, gh_z, self.gh_n = xp.split(gh, 3, axis=-1)
+        self.r = _sigmoid(xp, p_r + gh_r)
+        self.z = _sigmoid(xp, p_z + gh_z)
+        self.n = xp.tanh(p_n + self.r * self.gh_n)
+        return (1 - self.z) * self.n + self.z * h_prev.data
+
+    def backward(self, grad, proj, h_prev, weight_hh, bias_hh=None):
+        xp = proj.xp
+        g = grad.data
+        r, z, n = self.r, self.z, self.n
+        d_pre_n = g * (1 - z) * (1 - n * n)
+        d_pre_z = g * (h_prev.data - n) * z * (1 - z)
+        d_pre_r = d_pre_n * self.gh_n * r * (1 - r)
+
+        d_proj = xp.concatenate([d_pre_r, d_pre_z, d_pre_n], axis=-1)
+        d_gh = xp.concatenate([d_pre_r, d_pre_z, d_pre_n * r], axis=-1)
+        d_h_prev = g * z + d_gh @ weight_hh.data.T
+        grads = (IndexedGrad(self.index, d_proj), d_h_prev, h_prev.data.T @ d_gh)
+        if bias_hh is None:
+            return grads
+        return grads + (d_gh.sum(axis=0),)
+
+
+# The LSTM state is carried as one (B, 2H) array [h, c] so a timestep stays a single op.
+# Gate layout (i, f, g, o) along the last axis.
+class LSTMCell(Operation):
+    def __init__(self, index):
+        self.index = index
+
+    def forward(self, proj, state_prev, weight_hh):
+        xp = proj.xp
+        h_prev, self.c_prev = xp.split(state_prev.data, 2, axis=-1)
+        gates = proj.data[self.index] + h_prev @ weight_hh.data
+        i, f, g, o = xp.split(gates, 4, axis=-1)
+        self.i, self.f, self.o = _sigmoid(xp, i), _sigmoid(xp, f), _sigmoid(xp, o)
+        self.g = xp.tanh(g)
+        c = self.f * self.c_prev + self.i * self.g
+        self.tanh_c = xp.tanh(c)
+        self.h_prev = h_prev
+        return xp.concatenate([self.o * self.tanh_c, c], axis=-1)
+
+    def backward(self, grad, proj, state_prev, weight_hh):
+        xp = proj.xp
+        d_h, d_c = xp.split(grad.data, 2, axis=-1)
+        i, f, g, o = self.i, self.f, self.g, self.o
+        d_c = d_c + d_h * o * (1 - self.tanh_c * self.tanh_c)
+        d_gates = xp.concatenate([
+            d_c * g * i * (1 - i),
+            d_c * self.c_prev * f * (1 - f),
+            d_c * i * (1 - g * g),
+            d_h * self.tanh_c * o * (1 - o),
+        ], axis=-1)
+        d_state_prev = xp.concatenate([d_gates @ weight_hh.data.T, d_c * f], axis=-1)
+        return (
+            IndexedGrad(self.index, d_gates),
+            d_state_prev,
+            self.h_prev.T @ d_gates,
+        )
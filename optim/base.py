@@ -25,3 +25,4 @@ class Optimizer(ABC):
         for param in self.parameters:
             if hasattr(param, 'grad') and param.grad is not None:
                 param.grad = None
+            param.grad_sample = None
@@ -1,3 +1,5 @@
+import numpy
+
 from .base import Optimizer
 
 class SGD(Optimizer):
@@ -7,6 +9,20 @@ class SGD(Optimizer):
         self.momentum = momentum
         self.velocities = {}
 
+    def _per_member(self, value, param):
+        # Scalars (including NumPy scalars and 0-d arrays) apply to every parameter. A
+        # sequence holds one value per ensemble member and broadcasts over the leading
+        # (member) axis of parameters stacked by nn.Ensemble, which carry `n_members`.
+        if numpy.ndim(value) == 0:
+            return float(value)
+        n_members = getattr(param, 'n_members', None)
+        if n_members is None:
+            raise ValueError(f"Per-member hyperparameters only apply to parameters stacked by nn.Ensemble, got a parameter of shape {param.shape}")
+        value = param.xp.asarray(value, dtype=param.dtype)
+        if value.shape != (n_members,):
+            raise ValueError(f"Per-member hyperparameter of shape {value.shape} does not match an ensemble of {n_members} members")
+        return value.reshape((-1,) + (1,) * (param.data.ndim - 1))
+
     def step(self):
         for param in self.parameters:
             if param.grad is not None:
@@ -16,10 +32,9 @@ class SGD(Optimizer):
 
                 # Update velocity
                 v = self.velocities[param]
-                v *= self.momentum
-                v -= self.lr * param.grad.data
+                v *= self._per_member(self.momentum, param)
+                v -= self._per_member(self.lr, param) * param.grad.data
                 self.velocities[param] = v
 
                 # Update parameter
                 param.data += v
-
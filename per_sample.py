@@ -0,0 +1,56 @@
+# per_sample.py
+# Per-example gradients from a single batched backward pass.
+from .tensor import tensor
+from .core import per_sample as _state
+
+
+def per_sample_grads(loss, params, loss_reduction="mean"):
+    """
+    Backpropagate `loss` once and return the gradient of each example's loss for every
+    parameter in `params`, shape (batch, *param.shape). The result is also stored on
+    `param.grad_sample`. `loss_reduction` says how `loss` combined the examples: with
+    "mean" the per-sample gradients are rescaled by the batch size.
+    """
+    if loss_reduction not in ("mean", "sum"):
+        raise ValueError(f"loss_reduction must be 'mean' or 'sum', got {loss_reduction!r}")
+    params = list(params)
+    _state.start(params)
+    try:
+        loss.backward()
+    finally:
+        _state.stop()
+
+    for param in params:
+        if param.grad_sample is not None and loss_reduction == "mean":
+            param.grad_sample = param.grad_sample * param.grad_sample.shape[0]
+    return [param.grad_sample for param in params]
+
+
+def clip_per_sample_grads(params, max_norm, reduction="mean", eps=1e-6):
+    """
+    Clip every example's gradient (across all `params`) to an L2 norm of at most
+    `max_norm` and reduce over the batch, writing the result to `param.grad` so it can
+    be consumed by `Optimizer.step`. Clipping and summation are fused into a single
+    contraction per parameter. Returns the per-sample norms before clipping.
+    """
+    if reduction not in ("mean", "sum"):
+        raise ValueError(f"reduction must be 'mean' or 'sum', got {reduction!r}")
+    params = [p for p in params if p.grad_sample is not None]
+    if not params:
+        raise RuntimeError("No per-sample gradients found; call per_sample_grads first")
+
+    xp = params[0].xp
+    n = params[0].grad_sample.shape[0]
+    sq_norms = xp.zeros(n, dtype=params[0].grad_sample.dtype)
+    for param in params:
+        g = param.grad_sample.reshape(n, -1)
+        sq_norms += xp.einsum('ni,ni->n', g, g)
+    norms = xp.sqrt(sq_norms)
+
+    factor = xp.minimum(1.0, max_norm / (norms + eps))
+    if reduction == "mean":
+        factor /= n
+    for param in params:
+        grad = xp.tensordot(factor, param.grad_sample, axes=1)
+        param.grad = tensor(grad, requires_grad=False, device=param.device, dtype=param.dtype)
+    return norms
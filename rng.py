@@ -0,0 +1,87 @@
+# rng.py
+# Random number generation built on numpy.random.Generator. A process-wide default
+# generator backs tensor_init and layer initialisation; independent, reproducible
+# streams for modules or data-loading workers are derived by spawning from a seed.
+# Samples are drawn directly in the requested floating dtype (float32 stays float32)
+# and can be written into a preallocated buffer via `out=`.
+import numpy
+
+from .backend import get_xp
+
+_BIT_GENERATORS = {
+    "pcg64": numpy.random.PCG64,
+    "philox": numpy.random.Philox,
+}
+
+_default_seed_seq = numpy.random.SeedSequence()
+_default_generator = numpy.random.Generator(numpy.random.PCG64(_default_seed_seq))
+
+
+def generator(seed=None, bit_generator="pcg64"):
+    """Create a new independent Generator. `seed` may be an int, a SeedSequence or None."""
+    if bit_generator not in _BIT_GENERATORS:
+        raise ValueError(f"Unknown bit generator {bit_generator!r}, expected one of {sorted(_BIT_GENERATORS)}")
+    seed_seq = seed if isinstance(seed, numpy.random.SeedSequence) else numpy.random.SeedSequence(seed)
+    return numpy.random.Generator(_BIT_GENERATORS[bit_generator](seed_seq))
+
+
+def manual_seed(seed, bit_generator="pcg64"):
+    """Reseed the default generator used when no explicit generator is passed."""
+    global _default_seed_seq, _default_generator
+    _default_seed_seq = numpy.random.SeedSequence(seed)
+    _default_generator = generator(_default_seed_seq, bit_generator)
+    return _default_generator
+
+
+def default_generator():
+    return _default_generator
+
+
+def spawn(n, seed=None, bit_generator="pcg64"):
+    """
+    Return `n` statistically independent generators, e.g. one per worker. Children are
+    derived from `seed` (or from the default seed) so the set is reproducible.
+    """
+    parent = _default_seed_seq if seed is None else numpy.random.SeedSequence(seed)
+    return [generator(child, bit_generator) for child in parent.spawn(n)]
+
+
+def _float_dtype(dtype):
+    # Generators sample float32/float64 natively; anything else is drawn as float64
+    # and left for the caller to cast
+    dtype = numpy.dtype(numpy.float64 if dtype is None else dtype)
+    return dtype if dtype in (numpy.float32, numpy.float64) else numpy.dtype(numpy.float64)
+
+
+def _finish(data, device):
+    # Generators live on the host; other backends receive a copy of the samples
+    xp = get_xp(device)
+    return data if xp is numpy else xp.asarray(data)
+
+
+def uniform(shape, low=0.0, high=1.0, *, dtype=None, out=None, generator=None, device='cpu'):
+    gen = generator or _default_generator
+    dtype = _float_dtype(dtype if out is None else out.dtype)
+    data = gen.random(shape, dtype=dtype, out=out)
+    if low != 0.0 or high != 1.0:
+        data *= high - low
+        data += low
+    return _finish(data, device)
+
+
+def normal(shape, mean=0.0, std=1.0, *, dtype=None, out=None, generator=None, device='cpu'):
+    gen = generator or _default_generator
+    dtype = _float_dtype(dtype if out is None else out.dtype)
+    data = gen.standard_normal(shape, dtype=dtype, out=out)
+    if std != 1.0:
+        data *= std
+    if mean != 0.0:
+        data += mean
+    return _finish(data, device)
+
+
+def bernoulli(shape, p, *, generator=None, device='cpu'):
+    """Boolean mask with each element True with probability `p`."""
+    gen = generator or _default_generator
+    data = gen.random(shape, dtype=numpy.float32) < numpy.float32(p)
+    return _finish(data, device)
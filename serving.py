@@ -0,0 +1,195 @@
+# serving.py
+# Dynamic micro-batching for online inference: single-example requests are queued and
+# grouped into batches so the model runs at a useful BLAS batch size.
+import asyncio
+import collections
+import copy
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy
+
+from .tensor import tensor
+
+
+def _inference_replica(model):
+    # Frozen copy of the model: eval mode, and no parameter requires grad, so forward
+    # records no ops and builds no autograd graph
+    replica = copy.deepcopy(model)
+    replica.eval()
+    for param in replica.parameters():
+        param.requires_grad = False
+    return replica
+
+
+class BatchingServer:
+    """
+    Serve `model` to many concurrent callers. Requests submitted with `predict` wait on an
+    asyncio queue until `max_batch_size` of them are available or the oldest has waited
+    `max_wait_ms`; the batch is stacked along a new leading axis, run on a worker thread,
+    and each caller gets its own row of the output as a NumPy array. If a batch fails, its
+    examples are rerun one at a time so an error only reaches the callers that caused it.
+
+    The server runs on frozen copies of `model` (one per worker, so workers never share
+    layer workspaces); call `update(model)` to pick up new weights. Use it as
+    `async with BatchingServer(model) as server:` or call `start()`/`stop()` explicitly.
+    """
+    def __init__(self, model, max_batch_size=32, max_wait_ms=2.0, workers=1, history=10000):
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be a positive integer, got {max_batch_size}")
+        if workers < 1:
+            raise ValueError(f"workers must be a positive integer, got {workers}")
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1e3
+        self.workers = workers
+        self._model = model
+        self._latencies = collections.deque(maxlen=history)
+        self._batch_sizes = collections.deque(maxlen=history)
+        self._n_requests = 0
+        self._queue = None
+
+    async def start(self):
+        if self._queue is not None:
+            raise RuntimeError("Server is already running")
+        self._queue = asyncio.Queue()
+        self._replicas = asyncio.Queue()
+        for _ in range(self.workers):
+            self._replicas.put_nowait(_inference_replica(self._model))
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="tinynet-serving")
+        self._in_flight = set()
+        self._collector = asyncio.create_task(self._collect())
+        return self
+
+    async def stop(self):
+        """Finish the batches already running, then cancel requests still waiting in the queue."""
+        if self._queue is None:
+            return
+        self._collector.cancel()
+        await asyncio.gather(self._collector, return_exceptions=True)
+        await asyncio.gather(*self._in_flight, return_exceptions=True)
+        while not self._queue.empty():
+            _, future, _ = self._queue.get_nowait()
+            future.cancel()
+        self._executor.shutdown(wait=True)
+        self._queue = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+    def update(self, model):
+        """Serve `model` from now on; batches already running finish on the old weights."""
+        self._model = model
+        if self._queue is not None:
+            fresh = asyncio.Queue()
+            for _ in range(self.workers):
+                fresh.put_nowait(_inference_replica(model))
+            self._replicas = fresh
+
+    async def predict(self, example):
+        """Model output for one example (an array or tensor without the batch axis)."""
+        if self._queue is None:
+            raise RuntimeError("Server is not running; call start() first")
+        future = asyncio.get_running_loop().create_future()
+        data = example.data if isinstance(example, tensor) else example
+        self._queue.put_nowait((data, future, time.perf_counter()))
+        return await future
+
+    async def _collect(self):
+        while True:
+            # Wait for a free replica first: while every worker is busy, requests keep
+            # accumulating in the queue and the next batch comes out larger
+            replicas = self._replicas
+            replica = await replicas.get()
+            batch = []
+            try:
+                batch.append(await self._queue.get())
+                deadline = time.perf_counter() + self.max_wait
+                while len(batch) < self.max_batch_size:
+                    if not self._queue.empty():
+                        batch.append(self._queue.get_nowait())
+                        continue
+                    timeout = deadline - time.perf_counter()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+                if replicas is not self._replicas:
+                    # update() swapped the model while this batch was forming
+                    replicas = self._replicas
+                    replica = await replicas.get()
+            except asyncio.CancelledError:
+                for _, future, _ in batch:
+                    future.cancel()
+                raise
+            task = asyncio.create_task(self._dispatch(replica, replicas, batch))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    async def _dispatch(self, replica, replicas, batch):
+        loop = asyncio.get_running_loop()
+        try:
+            outputs = await loop.run_in_executor(self._executor, self._run, replica, [item[0] for item in batch])
+        except Exception as exc:
+            outputs = [exc] * len(batch)
+        finally:
+            replicas.put_nowait(replica)
+
+        now = time.perf_counter()
+        for (_, future, enqueued), output in zip(batch, outputs):
+            if not future.done():
+                if isinstance(output, Exception):
+                    future.set_exception(output)
+                else:
+                    future.set_result(output)
+            self._latencies.append(now - enqueued)
+        self._batch_sizes.append(len(batch))
+        self._n_requests += len(batch)
+
+    @classmethod
+    def _run(cls, model, examples):
+        try:
+            return list(cls._forward(model, examples))
+        except Exception:
+            if len(examples) == 1:
+                raise
+        # One malformed example must not fail everyone it was batched with: rerun them
+        # one at a time so only the offending callers get the error
+        outputs = []
+        for example in examples:
+            try:
+                outputs.append(cls._forward(model, [example])[0])
+            except Exception as exc:
+                outputs.append(exc)
+        return outputs
+
+    @staticmethod
+    def _forward(model, examples):
+        param = next(model.parameters(), None)
+        if param is None:
+            x = tensor(numpy.stack([numpy.asarray(e) for e in examples]))
+        else:
+            x = tensor(param.xp.stack([param.xp.asarray(e) for e in examples]), device=param.device, dtype=param.dtype)
+        return model(x).to_numpy()
+
+    def metrics(self):
+        """Latency percentiles (ms, queueing included) and batch sizes over the recent history."""
+        latencies = numpy.asarray(self._latencies) * 1e3
+        sizes = numpy.asarray(self._batch_sizes)
+        return {
+            "requests": self._n_requests,
+            "batches": len(sizes),
+            "mean_batch_size": float(sizes.mean()) if len(sizes) else 0.0,
+            "max_batch_size": int(sizes.max()) if len(sizes) else 0,
+            "p50_ms": float(numpy.percentile(latencies, 50)) if len(latencies) else 0.0,
+            "p99_ms": float(numpy.percentile(latencies, 99)) if len(latencies) else 0.0,
+        }
+
+    def reset_metrics(self):
+        self._latencies.clear()
+        self._batch_sizes.clear()
+        self._n_requests = 0
@@ -0,0 +1,130 @@
+# sparse.py
+# Compressed sparse row (CSR) input tensors. They never require grad themselves; they are
+# meant as inputs (e.g. bag-of-words features) multiplied into dense parameters.
+from .tensor import tensor
+from .backend import get_xp
+from .ops.sparse_ops import SparseMatMul
+
+
+class csr_tensor:
+    requires_grad = False
+
+    def __init__(self, indptr, indices, values, shape, device='cpu', dtype=None):
+        self.device = device
+        self.xp = get_xp(device)
+        xp = self.xp
+        self.indptr = xp.asarray(indptr, dtype=xp.int64)
+        self.indices = xp.asarray(indices, dtype=xp.int64)
+        self.values = xp.asarray(values) if dtype is None else xp.asarray(values, dtype=dtype)
+        self.shape = tuple(int(s) for s in shape)
+        self.dtype = self.values.dtype
+
+        if len(self.shape) != 2:
+            raise ValueError(f"csr_tensor must be 2-D, got shape {self.shape}")
+        if self.indptr.shape != (self.shape[0] + 1,):
+            raise ValueError(f"indptr must have length {self.shape[0] + 1}, got {self.indptr.shape[0]}")
+        if self.indices.shape != self.values.shape or self.indices.ndim != 1:
+            raise ValueError("indices and values must be 1-D arrays of the same length")
+        if int(self.indptr[0]) != 0 or int(self.indptr[-1]) != self.indices.shape[0]:
+            raise ValueError("indptr must start at 0 and end at the number of stored elements")
+        if self.shape[0] and bool((self.indptr[1:] < self.indptr[:-1]).any()):
+            raise ValueError("indptr must be non-decreasing")
+        if self.nnz and (int(self.indices.min()) < 0 or int(self.indices.max()) >= self.shape[1]):
+            raise ValueError(f"column indices must lie in [0, {self.shape[1]})")
+
+        # Lazily built index caches used by the matmul kernels
+        self._row_ids = None
+        self._column_order = None
+
+    @classmethod
+    def from_dense(cls, data, device=None, dtype=None):
+        if isinstance(data, tensor):
+            device = device or data.device
+            data = data.data
+        device = device or 'cpu'
+        xp = get_xp(device)
+        data = xp.asarray(data)
+        if data.ndim != 2:
+            raise ValueError(f"csr_tensor.from_dense expects a 2-D array, got {data.ndim}-D")
+        rows, cols = xp.nonzero(data)
+        counts = xp.bincount(rows, minlength=data.shape[0])
+        indptr = xp.concatenate([xp.zeros(1, dtype=xp.int64), xp.cumsum(counts)])
+        return cls(indptr, cols, data[rows, cols], data.shape, device=device, dtype=dtype)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['xp']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.xp = get_xp(self.device)
+
+    @property
+    def nnz(self):
+        return self.indices.shape[0]
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __repr__(self):
+        return f"csr_tensor(shape={self.shape}, nnz={self.nnz}, dtype={self.dtype}, device='{self.device}')"
+
+    def to_dense(self):
+        xp = self.xp
+        out = xp.zeros(self.shape, dtype=self.dtype)
+        out[xp.repeat(xp.arange(self.shape[0]), xp.diff(self.indptr)), self.indices] = self.values
+        return tensor(out, device=self.device, dtype=self.dtype)
+
+    def to(self, device):
+        if self.device == device:
+            return self
+        xp = get_xp(device)
+        to_host = getattr(self.xp, 'asnumpy', lambda a: a)
+        return csr_tensor(
+            xp.asarray(to_host(self.indptr)),
+            xp.asarray(to_host(self.indices)),
+            xp.asarray(to_host(self.values)),
+            self.shape,
+            device=device,
+        )
+
+    # Row selection for batching: int, slice or an array of row indices
+    def __getitem__(self, idx):
+        xp = self.xp
+        if isinstance(idx, tensor):
+            idx = idx.data
+        if isinstance(idx, slice):
+            start, stop, step = idx.indices(self.shape[0])
+            if step == 1:
+                lo, hi = int(self.indptr[start]), int(self.indptr[max(start, stop)])
+                return csr_tensor(
+                    self.indptr[start:max(start, stop) + 1] - lo,
+                    self.indices[lo:hi],
+                    self.values[lo:hi],
+                    (max(stop - start, 0), self.shape[1]),
+                    device=self.device,
+                )
+            idx = xp.arange(start, stop, step)
+        elif isinstance(idx, int):
+            idx = xp.asarray([idx])
+
+        rows = xp.asarray(idx, dtype=xp.int64)
+        n = self.shape[0]
+        if rows.size and (int(rows.min()) < -n or int(rows.max()) >= n):
+            raise IndexError(f"row index out of range for csr_tensor with {n} rows")
+        rows = xp.where(rows < 0, rows + n, rows)
+        starts = self.indptr[rows]
+        lengths = self.indptr[rows + 1] - starts
+        indptr = xp.concatenate([xp.zeros(1, dtype=xp.int64), xp.cumsum(lengths)])
+        positions = xp.repeat(starts - indptr[:-1], lengths) + xp.arange(int(indptr[-1]))
+        return csr_tensor(indptr, self.indices[positions], self.values[positions], (rows.shape[0], self.shape[1]), device=self.device)
+
+    def __matmul__(self, other):
+        if not isinstance(other, tensor):
+            raise TypeError(f"csr_tensor can only be multiplied with a dense tensor, got {type(other).__name__}")
+        op = SparseMatMul()
+        data = op.apply(self, other)
+        if not other.requires_grad:
+            return tensor(data, device=other.device, dtype=data.dtype)
+        return tensor(data, True, parents=[self, other], op=op, device=other.device, dtype=data.dtype)
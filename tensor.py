@@ -1,28 +1,39 @@
 # tensor class with device support
+import numpy
 from .backend import get_xp
 from .core.tensor_fn import *
+from .core.utils import accumulate_grad
         
 class tensor:
     def __init__(self, data, requires_grad=False, parents=None, op=None, device='cpu', dtype=None):
-        if device not in ['cpu', 'cuda']:
-            raise ValueError(f"Unsupported device: {device}. Supported devices are 'cpu' and 'cuda'.")
         self.device = device
-        self.xp = get_xp(device) # get the appropriate array library
+        self.xp = get_xp(device) # get the appropriate array library, raises for unknown devices
         if isinstance(data, tensor):
             data = data.data
         self.data = self.xp.array(data) if dtype is None else self.xp.array(data, dtype=dtype)
         self.dtype = self.data.dtype
         self.requires_grad = requires_grad
         self.grad = None
+        self.grad_sample = None
         self.parents = parents or []
         self.op = op
         self.is_leaf = self.requires_grad and op is None
 
 
+    # The array module is not picklable; drop it and re-resolve it from the device
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['xp']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.xp = get_xp(self.device)
+
     def to(self, device):
         if self.device == device:
             return self
-        data = self.xp.array(self.data) if device == 'cuda' else self.xp.asnumpy(self.data)
+        data = get_xp(device).asarray(self.to_numpy())
         new_tensor = tensor(
             data,
             requires_grad=self.requires_grad,
@@ -31,61 +42,74 @@ class tensor:
         )
         return new_tensor
     
-    def backward(self, grad=None, visited=None):
+    def backward(self, grad=None):
         if not self.requires_grad:
             return
 
-        if visited is None:
-            visited = set()
-        if id(self) in visited:
-            return
-        visited.add(id(self))
-
         # Implicit gradient only allowed for scalar outputs
         if grad is None:
             if self.data.size != 1:
                 raise RuntimeError("grad can be implicitly created only for scalar outputs")
-            grad = tensor(
-                self.xp.ones_like(self.data),
-                requires_grad=False,
-                device=self.device,
-                dtype=self.dtype
-            )
-        elif not isinstance(grad, tensor):
-            grad = tensor(
-                grad,
+            grad = self.xp.ones_like(self.data)
+        elif isinstance(grad, tensor):
+            grad = grad.data
+
+        # Topological order of the graph (iterative, so long chains such as unrolled
+        # recurrent layers do not hit the recursion limit)
+        order = []
+        seen = {id(self)}
+        stack = [(self, iter(self.parents or []))]
+        while stack:
+            node, parents = stack[-1]
+            for parent in parents:
+                if parent.requires_grad and id(parent) not in seen:
+                    seen.add(id(parent))
+                    stack.append((parent, iter(parent.parents or [])))
+                    break
+            else:
+                stack.pop()
+                order.append(node)
+
+        # Walk from the output back, summing the gradients of nodes used more than once
+        grads = {id(self): grad}
+        owned = set()
+        for node in reversed(order):
+            node_grad = grads.pop(id(node), None)
+            if node_grad is None:
+                continue
+            node_grad = tensor(
+                node_grad,
                 requires_grad=False,
-                device=self.device,
-                dtype=self.dtype
+                device=node.device,
+                dtype=node.dtype
             )
 
-        # Accumulate gradient only for leaf tensors
-        if self.is_leaf:
-            if self.grad is None:
-                self.grad = grad
-            else:
-                self.grad = self.grad + grad
-
-        # Propagate gradients
-        if self.op:
-            parent_grads = self.op.backward(grad, *self.parents)
-            for parent, parent_grad in zip(self.parents, parent_grads):
-                parent.backward(tensor(
-                    parent_grad,
-                    requires_grad=False,
-                    device=parent.device,
-                    dtype=parent.dtype
-                ), visited=visited)
-
-        # Free graph memory
-        self.op = None
-        self.parents = None
+            # Accumulate gradient only for leaf tensors
+            if node.is_leaf:
+                if node.grad is None:
+                    node.grad = node_grad
+                else:
+                    node.grad = node.grad + node_grad
+
+            # Propagate gradients
+            if node.op:
+                parent_grads = node.op.apply_backward(node_grad, *node.parents)
+                for parent, parent_grad in zip(node.parents, parent_grads):
+                    if parent.requires_grad and parent_grad is not None:
+                        accumulate_grad(grads, owned, parent, parent_grad)
+
+            # Free graph memory
+            node.op = None
+            node.parents = None
+
+    def detach(self):
+        return tensor(self.data, requires_grad=False, device=self.device, dtype=self.dtype)
 
     def __repr__(self):
         return self.data.__repr__().replace('array', 'tensor')
     
     def to_numpy(self):
-        if self.device == 'cpu':
+        if self.xp is numpy:
             return self.data
         else:
             return self.xp.asnumpy(self.data)
@@ -1,5 +1,6 @@
 from .tensor import tensor
 from .backend import get_xp
+from . import rng
 
 def _process_shape(shape):
     if len(shape) == 1 and isinstance(shape[0], (tuple, list)):
@@ -28,16 +29,14 @@ def full(*shape, fill_value, requires_grad=False, dtype=None, device='cpu'):
     data = xp.full(shape, fill_value, dtype=dtype)
     return tensor(data, requires_grad=requires_grad, device=device, dtype=dtype)
 
-def rand(*shape, requires_grad=False, dtype=None, device='cpu'):
+def rand(*shape, requires_grad=False, dtype=None, device='cpu', generator=None):
     shape = _process_shape(shape)
-    xp = get_xp(device)
-    data = xp.random.rand(*shape) if dtype is None else xp.random.rand(*shape).astype(dtype)
+    data = rng.uniform(shape, dtype=dtype, generator=generator, device=device)
     return tensor(data, requires_grad=requires_grad, device=device, dtype=dtype)
 
-def randn(*shape, requires_grad=False, dtype=None, device='cpu'):
+def randn(*shape, requires_grad=False, dtype=None, device='cpu', generator=None):
     shape = _process_shape(shape)
-    xp = get_xp(device)
-    data = xp.random.randn(*shape) if dtype is None else xp.random.randn(*shape).astype(dtype)
+    data = rng.normal(shape, dtype=dtype, generator=generator, device=device)
     return tensor(data, requires_grad=requires_grad, device=device, dtype=dtype)
 
 def arange(start, stop=None, step=1, *, dtype=None, requires_grad=False, device='cpu'):
@@ -0,0 +1,31 @@
+# Finite-difference helpers shared by the gradient tests.
+import numpy as np
+
+import tinynet as tn
+
+
+def numeric_grad(f, a, eps=1e-6):
+    """Central differences of the scalar f() with respect to every entry of `a` (modified in place)."""
+    grad = np.zeros_like(a)
+    for i in np.ndindex(a.shape):
+        orig = a[i]
+        a[i] = orig + eps
+        plus = f()
+        a[i] = orig - eps
+        minus = f()
+        a[i] = orig
+        grad[i] = (plus - minus) / (2 * eps)
+    return grad
+
+
+def check(fn, *arrays, atol=1e-5):
+    """Compare autograd and numeric gradients of sum(fn(*tensors) * weights) for every input."""
+    rng = np.random.default_rng(0)
+    out_shape = fn(*[tn.tensor(a) for a in arrays]).shape
+    weights = tn.tensor(rng.standard_normal(out_shape))
+    inputs = [tn.tensor(a, requires_grad=True) for a in arrays]
+    (fn(*inputs) * weights).sum().backward()
+    for x, a in zip(inputs, arrays):
+        expected = numeric_grad(lambda: float((fn(*[tn.tensor(b) for b in arrays]) * weights).sum().data), a)
+        assert x.grad is not None
+        np.testing.assert_allclose(x.grad.data, expected, atol=atol)
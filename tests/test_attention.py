@@ -0,0 +1,27 @@
+# Blockwise scaled dot-product attention against the dense softmax(q k^T) v.
+import numpy as np
+import pytest
+
+import tinynet as tn
+from tinynet.functional import scaled_dot_product_attention
+
+from .gradcheck import check
+
+
+def reference_attention(q, k, v, causal=False):
+    s = q @ np.swapaxes(k, -1, -2) / np.sqrt(q.shape[-1])
+    if causal:
+        s = np.where(np.triu(np.ones(s.shape[-2:], dtype=bool), k=1), -np.inf, s)
+    p = np.exp(s - s.max(axis=-1, keepdims=True))
+    return p / p.sum(axis=-1, keepdims=True) @ v
+
+
+@pytest.mark.parametrize("causal", [False, True])
+@pytest.mark.parametrize("block_size", [2, 3, 128])
+def test_attention_matches_dense(causal, block_size):
+    rng = np.random.default_rng(0)
+    q, k, v = rng.standard_normal((2, 5, 4)), rng.standard_normal((2, 7, 4)), rng.standard_normal((2, 7, 3))
+    attend = lambda q, k, v: scaled_dot_product_attention(q, k, v, causal=causal, block_size=block_size)
+    out = attend(tn.tensor(q), tn.tensor(k), tn.tensor(v))
+    np.testing.assert_allclose(out.data, reference_attention(q, k, v, causal), atol=1e-12)
+    check(attend, q, k, v)
@@ -0,0 +1,116 @@
+# Finite-difference checks for the autograd engine: gradient summation for reused
+# tensors, sparse slice gradients (IndexedGrad) and graphs deeper than the recursion limit.
+import sys
+
+import numpy as np
+
+import tinynet as tn
+import tinynet.nn as nn
+
+from .gradcheck import numeric_grad, check
+
+
+def test_reused_leaf():
+    rng = np.random.default_rng(1)
+    check(lambda x: x * x + x, rng.standard_normal((3, 4)))
+
+
+def test_reused_intermediate():
+    rng = np.random.default_rng(2)
+
+    def fn(x, w):
+        h = x @ w
+        return h * h + tn.functional.sigmoid(h)
+    check(fn, rng.standard_normal((3, 4)), rng.standard_normal((4, 2)))
+
+
+def test_getitem_duplicate_indices():
+    rng = np.random.default_rng(3)
+    check(lambda x: x[[0, 0, 2, 0]], rng.standard_normal((4, 3)))
+
+
+def test_getitem_advanced_indices():
+    rng = np.random.default_rng(4)
+    idx = np.array([[1, 1], [3, 0]])
+    check(lambda x: x[idx], rng.standard_normal((4, 3)))
+    check(lambda x: x[np.array([0, 2, 2]), np.array([1, 1, 0])], rng.standard_normal((3, 3)))
+
+
+def test_getitem_overlapping_slices():
+    rng = np.random.default_rng(5)
+    check(lambda x: x[1:3] * x[0:2] + x[1:3], rng.standard_normal((4, 3)))
+
+
+def test_stack_indexed_grad_accumulation():
+    rng = np.random.default_rng(6)
+
+    def fn(x):
+        # Each row gets sparse slice gradients from several stack entries plus a dense one
+        return tn.stack([x[0], x[0] * 2.0, x[1], x[2] * x[0]], axis=0) + x[:1]
+    check(fn, rng.standard_normal((3, 5)))
+
+
+def test_lstm_gradients():
+    tn.rng.manual_seed(0)
+    lstm = nn.LSTM(3, 4)
+    x_data = np.random.default_rng(7).standard_normal((6, 2, 3))
+    weights = np.random.default_rng(8).standard_normal((6, 2, 4))
+    x = tn.tensor(x_data, requires_grad=True)
+    (lstm(x)[0] * tn.tensor(weights)).sum().backward()
+
+    loss = lambda: float((lstm(tn.tensor(x_data))[0].data * weights).sum())
+    np.testing.assert_allclose(x.grad.data, numeric_grad(loss, x_data), atol=1e-5)
+    for param in lstm.parameters():
+        np.testing.assert_allclose(param.grad.data, numeric_grad(loss, param.data), atol=1e-5)
+
+
+def test_lstm_initial_state_gradients():
+    tn.rng.manual_seed(1)
+    lstm = nn.LSTM(3, 4, batch_first=True)
+    rng = np.random.default_rng(10)
+    x, h0, c0 = rng.standard_normal((2, 5, 3)), rng.standard_normal((2, 4)), rng.standard_normal((2, 4))
+
+    def fn(x, h0, c0):
+        output, (h_n, c_n) = lstm(x, (h0, c0))
+        return output.sum(axis=1) + c_n
+    check(fn, x, h0, c0)
+
+
+def test_gru_gradients():
+    rng = np.random.default_rng(11)
+    x, h0 = rng.standard_normal((5, 2, 3)), rng.standard_normal((2, 4))
+    for bias in (True, False):
+        gru = nn.GRU(3, 4, bias=bias, generator=tn.rng.generator(2))
+        assert (gru.bias_hh is None) == (gru.bias_ih is None) == (not bias)
+        check(lambda x, h0: gru(x, h0)[0], x, h0)
+
+        for param in gru.parameters():
+            param.grad = None
+        weights = rng.standard_normal((5, 2, 4))
+        (gru(tn.tensor(x), tn.tensor(h0))[0] * tn.tensor(weights)).sum().backward()
+        loss = lambda: float((gru(tn.tensor(x), tn.tensor(h0))[0].data * weights).sum())
+        for param in gru.parameters():
+            np.testing.assert_allclose(param.grad.data, numeric_grad(loss, param.data), atol=1e-5)
+
+
+def test_lstm_longer_than_recursion_limit():
+    tn.rng.manual_seed(0)
+    lstm = nn.LSTM(1, 2)
+    seq_len = sys.getrecursionlimit() + 100
+    x_data = np.random.default_rng(9).standard_normal((seq_len, 1, 1)) * 0.1
+    x = tn.tensor(x_data, requires_grad=True)
+    output, (h_n, c_n) = lstm(x)
+    h_n.sum().backward()
+
+    assert all(np.isfinite(p.grad.data).all() for p in lstm.parameters())
+    # Spot-check the input gradient at the last and first timesteps
+    loss = lambda: float(lstm(tn.tensor(x_data))[1][0].data.sum())
+    for t in (seq_len - 1, 0):
+        eps = 1e-6
+        orig = x_data[t, 0, 0]
+        x_data[t, 0, 0] = orig + eps
+        plus = loss()
+        x_data[t, 0, 0] = orig - eps
+        minus = loss()
+        x_data[t, 0, 0] = orig
+        np.testing.assert_allclose(x.grad.data[t, 0, 0], (plus - minus) / (2 * eps), atol=1e-6)
@@ -0,0 +1,60 @@
+# Conv2d / MaxPool2d against direct NumPy loops, plus finite-difference gradients.
+import numpy as np
+import pytest
+
+import tinynet as tn
+from tinynet.functional import conv2d, max_pool2d
+
+from .gradcheck import check
+
+
+def reference_conv(x, w, b, stride, padding):
+    N, C, H, W = x.shape
+    F, _, kh, kw = w.shape
+    x = np.pad(x, ((0, 0), (0, 0), (padding, padding), (padding, padding)))
+    OH, OW = (H + 2 * padding - kh) // stride + 1, (W + 2 * padding - kw) // stride + 1
+    out = np.empty((N, F, OH, OW))
+    for i in range(OH):
+        for j in range(OW):
+            window = x[:, :, i * stride:i * stride + kh, j * stride:j * stride + kw]
+            out[:, :, i, j] = np.einsum("nchw,fchw->nf", window, w) + b
+    return out
+
+
+def reference_max_pool(x, k, stride, padding):
+    N, C, H, W = x.shape
+    OH, OW = (H + 2 * padding - k) // stride + 1, (W + 2 * padding - k) // stride + 1
+    out = np.empty((N, C, OH, OW), dtype=x.dtype)
+    for i in range(OH):
+        for j in range(OW):
+            h0, w0 = i * stride - padding, j * stride - padding
+            window = x[:, :, max(h0, 0):h0 + k, max(w0, 0):w0 + k]
+            out[:, :, i, j] = window.max(axis=(2, 3))
+    return out
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.int32, np.int8])
+def test_max_pool_padding_never_wins(dtype):
+    # All-negative inputs: a zero (or wrapped) pad value would leak into the output
+    x = -np.arange(1, 33).reshape(1, 2, 4, 4).astype(dtype)
+    out = max_pool2d(tn.tensor(x), 3, stride=2, padding=1)
+    assert out.dtype == dtype
+    np.testing.assert_array_equal(out.data, reference_max_pool(x, 3, 2, 1))
+
+
+@pytest.mark.parametrize("stride, padding", [(1, 0), (1, 1), (2, 1)])
+def test_conv_matches_loops(stride, padding):
+    rng = np.random.default_rng(0)
+    x, w, b = rng.standard_normal((2, 3, 5, 6)), rng.standard_normal((4, 3, 3, 2)), rng.standard_normal(4)
+    out = conv2d(tn.tensor(x), tn.tensor(w), tn.tensor(b), stride=stride, padding=padding)
+    np.testing.assert_allclose(out.data, reference_conv(x, w, b, stride, padding), atol=1e-12)
+    check(lambda x, w, b: conv2d(x, w, b, stride=stride, padding=padding), x, w, b)
+
+
+@pytest.mark.parametrize("k, stride, padding", [(2, 2, 0), (3, 2, 1), (3, 1, 1)])
+def test_max_pool_matches_loops(k, stride, padding):
+    # A permutation keeps every window maximum unique, so the finite differences are exact
+    x = np.random.default_rng(1).permutation(2 * 3 * 6 * 6).reshape(2, 3, 6, 6) / 10.0
+    out = max_pool2d(tn.tensor(x), k, stride=stride, padding=padding)
+    np.testing.assert_array_equal(out.data, reference_max_pool(x, k, stride, padding))
+    check(lambda x: max_pool2d(x, k, stride=stride, padding=padding), x)
@@ -0,0 +1,68 @@
+# Vectorized ensembles: stacked training matches training each member alone, and
+# members or hyperparameters that cannot be stacked are rejected up front.
+import copy
+
+import numpy as np
+import pytest
+
+import tinynet as tn
+import tinynet.nn as nn
+import tinynet.optim as optim
+
+
+class MLP(nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.hidden = nn.Linear(6, 8)
+        self.act = nn.ReLU()
+        self.out = nn.Linear(8, 3)
+
+    def forward(self, x):
+        return self.out(self.act(self.hidden(x)))
+
+
+def test_matches_members_trained_alone():
+    tn.rng.manual_seed(0)
+    members = [MLP() for _ in range(3)]
+    alone = [copy.deepcopy(m) for m in members]
+    ensemble = nn.Ensemble(members)
+    lrs = [0.1, 0.05, 0.2]
+    x, y = tn.randn(16, 6), tn.tensor(np.arange(16) % 3)
+    loss_fn = nn.CrossEntropyLoss()
+
+    optimizer = optim.SGD(ensemble.parameters(), lr=lrs, momentum=0.9)
+    optimizers = [optim.SGD(m.parameters(), lr=lr, momentum=0.9) for m, lr in zip(alone, lrs)]
+    for _ in range(3):
+        optimizer.zero_grad()
+        ensemble.loss(loss_fn, ensemble(x), y).backward()
+        optimizer.step()
+        for m, opt in zip(alone, optimizers):
+            opt.zero_grad()
+            loss_fn(m(x), y).backward()
+            opt.step()
+    for i, m in enumerate(alone):
+        for (name, stacked), (_, single) in zip(ensemble.member(i).named_parameters(), m.named_parameters()):
+            np.testing.assert_allclose(stacked.data, single.data, atol=1e-12, err_msg=name)
+
+
+@pytest.mark.parametrize("make", [lambda: nn.LayerNorm(4), lambda: nn.Conv2d(1, 2, 3)])
+def test_rejects_layers_that_cannot_be_stacked(make):
+    with pytest.raises(TypeError, match="only stack Linear"):
+        nn.Ensemble([make(), make()])
+
+
+def test_rejects_members_with_different_structure():
+    with pytest.raises(ValueError, match="differ"):
+        nn.Ensemble([MLP(), nn.Linear(6, 3)])
+
+
+def test_per_member_hyperparameters_need_stacked_parameters():
+    ensemble = nn.Ensemble([nn.Linear(4, 2), nn.Linear(4, 2)])
+    extra = tn.tensor(np.zeros(2), requires_grad=True)
+    optimizer = optim.SGD(list(ensemble.parameters()) + [extra], lr=[0.1, 0.2])
+    ensemble.loss(nn.MSELoss(), ensemble(tn.randn(5, 4)), tn.randn(5, 2)).backward()
+    extra.grad = tn.tensor(np.ones(2))
+    with pytest.raises(ValueError, match="stacked by nn.Ensemble"):
+        optimizer.step()
+    with pytest.raises(ValueError, match="2 members"):
+        optim.SGD(ensemble.parameters(), lr=[0.1, 0.2, 0.3]).step()
@@ -0,0 +1,61 @@
+# Matmul and einsum against NumPy: output shapes, values and finite-difference gradients.
+import numpy as np
+import pytest
+
+import tinynet as tn
+
+from .gradcheck import check
+
+
+MATMUL_SHAPES = [
+    ((3, 4), (4, 5)),
+    ((4,), (4, 5)),
+    ((3, 4), (4,)),
+    ((4,), (4,)),
+    ((2, 3, 4), (4,)),
+    ((4,), (2, 4, 5)),
+    ((2, 1, 3, 4), (5, 4, 2)),
+]
+
+
+@pytest.mark.parametrize("a_shape, b_shape", MATMUL_SHAPES)
+def test_matmul_matches_numpy(a_shape, b_shape):
+    rng = np.random.default_rng(0)
+    a, b = rng.standard_normal(a_shape), rng.standard_normal(b_shape)
+    out = tn.tensor(a) @ tn.tensor(b)
+    assert out.shape == np.matmul(a, b).shape
+    np.testing.assert_allclose(out.data, np.matmul(a, b), atol=1e-12)
+    check(lambda a, b: a @ b, a, b)
+
+
+EINSUM_CASES = [
+    ("ij,jk->ik", [(3, 4), (4, 5)]),
+    ("bij,bjk->bik", [(2, 3, 4), (2, 4, 5)]),
+    ("...ij,jk", [(2, 3, 4), (4, 5)]),
+    ("ij,ij->", [(3, 4), (3, 4)]),
+    ("ij,j->i", [(3, 4), (1,)]),
+    ("ij,jk,kl->il", [(2, 3), (3, 4), (4, 2)]),
+]
+
+
+@pytest.mark.parametrize("subscripts, shapes", EINSUM_CASES)
+def test_einsum_matches_numpy(subscripts, shapes):
+    rng = np.random.default_rng(1)
+    arrays = [rng.standard_normal(s) for s in shapes]
+    out = tn.functional.einsum(subscripts, *[tn.tensor(a) for a in arrays])
+    np.testing.assert_allclose(out.data, np.einsum(subscripts, *arrays), atol=1e-12)
+    check(lambda *xs: tn.functional.einsum(subscripts, *xs), *arrays)
+
+
+def test_einsum_repeated_labels_require_no_grad():
+    x = np.random.default_rng(2).standard_normal((3, 3))
+    np.testing.assert_allclose(tn.functional.einsum("ii->i", tn.tensor(x)).data, np.diag(x))
+    with pytest.raises(NotImplementedError):
+        tn.functional.einsum("ii->i", tn.tensor(x, requires_grad=True))
+
+
+def test_einsum_plan_cache_is_bounded():
+    from tinynet.ops import einsum_ops
+    for n in range(einsum_ops._PLAN_CACHE_SIZE + 10):
+        tn.functional.einsum("ij->j", tn.tensor(np.ones((1, n + 1))))
+    assert len(einsum_ops._plan_cache) == einsum_ops._PLAN_CACHE_SIZE
@@ -0,0 +1,76 @@
+# Fused LayerNorm / BatchNorm against a NumPy reference, for every combination of affine terms.
+import numpy as np
+import pytest
+
+import tinynet as tn
+from tinynet.functional import layer_norm, batch_norm
+
+from .gradcheck import check
+
+
+def reference(x, axes, weight=None, bias=None, param_shape=None, eps=1e-5):
+    centered = x - x.mean(axis=axes, keepdims=True)
+    out = centered / np.sqrt((centered * centered).mean(axis=axes, keepdims=True) + eps)
+    if weight is not None:
+        out = out * (np.reshape(weight, param_shape) if np.ndim(weight) else weight)
+    if bias is not None:
+        out = out + (np.reshape(bias, param_shape) if np.ndim(bias) else bias)
+    return out
+
+
+AFFINE = [(False, False), (True, False), (False, True), (True, True)]
+
+
+@pytest.mark.parametrize("has_weight, has_bias", AFFINE)
+def test_layer_norm_affine_combinations(has_weight, has_bias):
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal((4, 3, 6)) * 2 + 1
+    weight = rng.standard_normal(6) if has_weight else None
+    bias = rng.standard_normal(6) if has_bias else None
+    out = layer_norm(tn.tensor(x), 6, None if weight is None else tn.tensor(weight), None if bias is None else tn.tensor(bias))
+    np.testing.assert_allclose(out.data, reference(x, (2,), weight, bias, (6,)), atol=1e-10)
+
+    params = [p for p in (weight, bias) if p is not None]
+    def fn(x, *ps):
+        ps = list(ps)
+        return layer_norm(x, 6, ps.pop(0) if has_weight else None, ps.pop(0) if has_bias else None)
+    check(fn, x, *params)
+
+
+@pytest.mark.parametrize("has_weight, has_bias", AFFINE)
+def test_batch_norm_affine_combinations(has_weight, has_bias):
+    rng = np.random.default_rng(1)
+    x = rng.standard_normal((8, 3, 5)) * 3 - 2
+    weight = rng.standard_normal(3) if has_weight else None
+    bias = rng.standard_normal(3) if has_bias else None
+    out = batch_norm(tn.tensor(x), weight=None if weight is None else tn.tensor(weight), bias=None if bias is None else tn.tensor(bias))
+    np.testing.assert_allclose(out.data, reference(x, (0, 2), weight, bias, (1, 3, 1)), atol=1e-10)
+
+    params = [p for p in (weight, bias) if p is not None]
+    def fn(x, *ps):
+        ps = list(ps)
+        return batch_norm(x, weight=ps.pop(0) if has_weight else None, bias=ps.pop(0) if has_bias else None)
+    check(fn, x, *params)
+
+
+def test_scalar_affine_terms():
+    rng = np.random.default_rng(2)
+    x = rng.standard_normal((5, 6))
+    np.testing.assert_allclose(layer_norm(tn.tensor(x), 6, bias=5).data, reference(x, (1,), bias=5), atol=1e-10)
+    np.testing.assert_allclose(batch_norm(tn.tensor(x), weight=2.0).data, reference(x, (0,), weight=2.0), atol=1e-10)
+
+
+def test_batch_norm_eval_uses_running_stats():
+    rng = np.random.default_rng(3)
+    x = rng.standard_normal((6, 4))
+    mean, var = rng.standard_normal(4), rng.random(4) + 0.5
+    out = batch_norm(tn.tensor(x), mean.copy(), var.copy(), training=False)
+    np.testing.assert_allclose(out.data, (x - mean) / np.sqrt(var + 1e-5), atol=1e-12)
+    check(lambda x: batch_norm(x, mean.copy(), var.copy(), training=False), x)
+
+
+def test_large_offset_float32():
+    rng = np.random.default_rng(4)
+    x = (rng.standard_normal((256, 8)) + 1000).astype(np.float32)
+    out = batch_norm(tn.tensor(x)).data
+    np.testing.assert_allclose(out, reference(x.astype(np.float64), (0,)), atol=1e-4)
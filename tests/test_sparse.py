@@ -0,0 +1,42 @@
+# csr_tensor construction checks and sparse @ dense matmul against the dense product.
+import numpy as np
+import pytest
+
+import tinynet as tn
+from tinynet.sparse import csr_tensor
+
+from .gradcheck import check
+
+
+def random_sparse(rng, shape, density=0.3):
+    return rng.standard_normal(shape) * (rng.random(shape) < density)
+
+
+@pytest.mark.parametrize("indptr, indices, message", [
+    ([0, 1, 2], [0, 3], "column indices"),
+    ([0, 1, 2], [-1, 0], "column indices"),
+    ([0, 2, 1, 2], [0, 1], "length"),
+    ([0, 3, 2], [0, 1], "non-decreasing"),
+    ([1, 1, 2], [0, 1], "start at 0"),
+    ([0, 1], [0], "length"),
+])
+def test_invalid_structure_is_rejected(indptr, indices, message):
+    with pytest.raises(ValueError, match=message):
+        csr_tensor(indptr, indices, np.ones(len(indices)), (2, 3))
+
+
+def test_matmul_matches_dense():
+    rng = np.random.default_rng(0)
+    dense = random_sparse(rng, (7, 5))
+    dense[3] = 0  # an empty row
+    weight = rng.standard_normal((5, 4))
+    sparse = csr_tensor.from_dense(dense)
+    np.testing.assert_allclose((sparse @ tn.tensor(weight)).data, dense @ weight, atol=1e-12)
+    np.testing.assert_allclose((sparse[[4, 0, 4]] @ tn.tensor(weight)).data, dense[[4, 0, 4]] @ weight, atol=1e-12)
+    check(lambda w: sparse @ w, weight)
+
+
+def test_matmul_without_grad_builds_no_graph():
+    sparse = csr_tensor.from_dense(np.eye(3))
+    out = sparse @ tn.tensor(np.ones((3, 2)))
+    assert not out.requires_grad and out.op is None and out.parents == []